@@ -4,19 +4,24 @@ This package contains environment definitions that can be used for:
 - Teleoperation
 - RL training
 - Evaluation
+
+Importing the package registers the environments with gymnasium. The environment configuration module is only
+imported when the environment is created, through the ``env_cfg_entry_point`` string.
 """
 
 import gymnasium as gym
 
-# Register custom environments with gymnasium
-gym.register(
-    id="NineRingsInspire-v0",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
-    disable_env_checker=True,
-    kwargs={
-        "env_cfg_entry_point": "environments.nine_rings_inspire_env_cfg:NineRingsInspireEnvCfg",
-    },
-)
+ENV_ID = "NineRingsInspire-v0"
 
-__all__ = ["NineRingsInspire-v0"]
+# Register custom environments with gymnasium (skipped if the package is reloaded)
+if ENV_ID not in gym.envs.registry:
+    gym.register(
+        id=ENV_ID,
+        entry_point="isaaclab.envs:ManagerBasedRLEnv",
+        disable_env_checker=True,
+        kwargs={
+            "env_cfg_entry_point": "environments.nine_rings_inspire_env_cfg:NineRingsInspireEnvCfg",
+        },
+    )
 
+__all__ = ["ENV_ID"]
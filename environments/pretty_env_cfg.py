@@ -13,25 +13,93 @@ if __name__ == "__main__":
     parser.add_argument(
         "--num_envs", type=int, default=1, help="Number of environments to spawn."
     )
+    parser.add_argument(
+        "--sequential_asset_load",
+        action="store_true",
+        default=False,
+        help="Do not open the scene's USD files concurrently before spawning the scene.",
+    )
     AppLauncher.add_app_launcher_args(parser)
     args_cli = parser.parse_args()
     app_launcher = AppLauncher(args_cli)
     simulation_app = app_launcher.app
 
 
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import isaaclab.sim as sim_utils
-from isaaclab.actuators import ImplicitActuatorCfg
-from isaaclab.assets import ArticulationCfg, AssetBaseCfg
-from isaaclab_assets.robots.shadow_hand import SHADOW_HAND_CFG
-from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
+from isaaclab.assets import AssetBaseCfg
 from isaaclab.envs import ManagerBasedEnvCfg, ManagerBasedEnv
-from isaaclab.managers import EventTermCfg as EventTerm
-from isaaclab.managers import ObservationGroupCfg as ObsGroup
-from isaaclab.managers import ObservationTermCfg as ObsTerm
-from isaaclab.managers import SceneEntityCfg
 from isaaclab.scene import InteractiveSceneCfg
 from isaaclab.utils import configclass
 
+# Note: the commented-out hand, arm, observation and event configurations below additionally need
+# SHADOW_HAND_CFG (isaaclab_assets.robots.shadow_hand), ArticulationCfg (isaaclab.assets),
+# ImplicitActuatorCfg (isaaclab.actuators) and the manager term configs (isaaclab.managers).
+# They are not imported here to keep the import of this module light.
+
+
+def scene_usd_paths(scene_cfg: InteractiveSceneCfg) -> list[str]:
+    """Collect the USD files spawned by the assets of a scene configuration.
+
+    Args:
+        scene_cfg: Scene configuration.
+
+    Returns:
+        Paths of the USD files of all assets spawned from a :class:`~isaaclab.sim.UsdFileCfg`.
+    """
+    return [
+        asset.spawn.usd_path
+        for asset in vars(scene_cfg).values()
+        if isinstance(asset, AssetBaseCfg) and isinstance(asset.spawn, sim_utils.UsdFileCfg)
+    ]
+
+
+def preload_usd_layers(usd_paths: list[str]) -> list:
+    """Open the root layers of USD files concurrently.
+
+    Holding the returned layer handles keeps the layers in USD's layer registry, so spawning a scene that references
+    them does not parse the files again. Keep the handles for as long as the stage uses the layers (e.g. until the
+    environment is closed); layers released before the scene is spawned are dropped and parsed a second time.
+    Files that do not exist are skipped.
+
+    Args:
+        usd_paths: Paths to the USD files to open.
+
+    Returns:
+        Handles of the opened layers.
+    """
+    from pxr import Sdf
+
+    paths = sorted({os.path.abspath(path) for path in usd_paths if os.path.isfile(path)})
+    if not paths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        return [layer for layer in executor.map(Sdf.Layer.FindOrOpen, paths) if layer]
+
+
+def _prefer_usdc(usda_path: str) -> str:
+    """Use the binary crate file next to an ASCII USD file if it has been generated and is up to date.
+
+    Crate files are memory-mapped on load instead of parsed. They are generated with
+    ``scripts/tools/convert_usda_to_usdc.py``; nothing is written here.
+
+    Args:
+        usda_path: Path to the ASCII USD file.
+
+    Returns:
+        Path to the crate file, or the original path if there is no up-to-date crate file.
+    """
+    usdc_path = os.path.splitext(usda_path)[0] + ".usdc"
+    if not os.path.isfile(usdc_path):
+        return usda_path
+    if os.path.isfile(usda_path) and os.path.getmtime(usdc_path) < os.path.getmtime(usda_path):
+        return usda_path
+    return usdc_path
+
 
 @configclass
 class NineLinkedRingsSceneCfg(InteractiveSceneCfg):
@@ -40,7 +108,7 @@ class NineLinkedRingsSceneCfg(InteractiveSceneCfg):
     ground = AssetBaseCfg(
         prim_path="/World/ground",
         spawn=sim_utils.UsdFileCfg(
-            usd_path="./assets/ground_plane/ground_plane.usda",
+            usd_path=_prefer_usdc("./assets/ground_plane/ground_plane.usda"),
         ),
     )
 
@@ -57,7 +125,7 @@ class NineLinkedRingsSceneCfg(InteractiveSceneCfg):
     puzzle = AssetBaseCfg(
         prim_path="{ENV_REGEX_NS}/NineLinkedRings",
         spawn=sim_utils.UsdFileCfg(
-            usd_path="./assets/nine_linked_rings/nine_linked_rings.usda",
+            usd_path=_prefer_usdc("./assets/nine_linked_rings/nine_linked_rings.usda"),
         ),
         init_state=AssetBaseCfg.InitialStateCfg(
             pos=(0.0, 0.0, 1.0),  # Position in front of robot
@@ -225,6 +293,12 @@ class NineLinkedRingsEnvCfg(ManagerBasedEnvCfg):
     commands: CommandsCfg = CommandsCfg()
     events: EventCfg = EventCfg()
 
+    load_assets_parallel: bool = True
+    """Whether to open the USD files of the scene concurrently before the scene is spawned. Defaults to True.
+
+    See :func:`preload_usd_layers`.
+    """
+
     def __post_init__(self):
         """Post initialization."""
         # Viewer settings
@@ -249,14 +323,26 @@ def main():
     env_cfg = NineLinkedRingsEnvCfg()
     env_cfg.scene.num_envs = args_cli.num_envs
     env_cfg.sim.device = args_cli.device
+    env_cfg.load_assets_parallel = not args_cli.sequential_asset_load
+    # parse the scene's USD files concurrently. The layer handles are held for the lifetime of the stage, i.e.
+    # until the environment is closed, otherwise USD drops the parsed layers before the scene references them.
+    start_time = time.perf_counter()
+    usd_layers = preload_usd_layers(scene_usd_paths(env_cfg.scene)) if env_cfg.load_assets_parallel else []
     env = ManagerBasedEnv(cfg=env_cfg)
+    print(f"[INFO]: Created environment in {time.perf_counter() - start_time:.2f} s")
+
+    # episode length in integer steps (at least one), so the reset check is an integer modulo
+    steps_per_episode = max(1, round(env_cfg.episode_length_s / (env_cfg.sim.dt * env_cfg.decimation)))
 
     count = 0
-    joint_efforts = 0.5 * (torch.rand_like(env.action_manager.action) - 0.5)
-    while simulation_app.is_running():
-        with torch.inference_mode():
+    # sample efforts in [-0.25, 0.25) into a persistent buffer (resample in place with uniform_)
+    joint_efforts = torch.empty_like(env.action_manager.action)
+    joint_efforts.uniform_(-0.25, 0.25)
+    # the demo never needs gradients, so enter inference mode once for the whole run
+    with torch.inference_mode():
+        while simulation_app.is_running():
             # reset
-            if count % env_cfg.episode_length_s == 0:
+            if count % steps_per_episode == 0:
                 count = 0
                 env.reset()
                 print("-" * 80)
@@ -266,6 +352,7 @@ def main():
             count += 1
 
     env.close()
+    del usd_layers
 
 
 if __name__ == "__main__":
@@ -37,6 +37,23 @@ extern "C" {
     return (actual_count == 0) ? -2 : 0;
   }
 
+  int poll_soa(int32_t *node_ids, int32_t *sides, float *positions,
+               float *orientations, uint32_t buffer_size, uint32_t *count) {
+    if (!Bridge::s_Instance) {
+      return -1; // Not initialized
+    }
+    if (!node_ids || !sides || !positions || !orientations || !count) {
+      return -3; // Invalid arguments
+    }
+    uint32_t actual_count = 0;
+    Bridge::s_Instance->PollSoa(node_ids, sides, positions, orientations,
+                                buffer_size, actual_count);
+    *count = actual_count;
+
+    // Return -2 if no data is available (count is 0)
+    return (actual_count == 0) ? -2 : 0;
+  }
+
   int shutdown() {
     if (!Bridge::s_Instance) {
       return -1; // Not initialized
@@ -52,7 +69,10 @@ Bridge *Bridge::s_Instance = nullptr;
 
 Bridge::Bridge() { s_Instance = this; }
 
-Bridge::~Bridge() { s_Instance = nullptr; }
+Bridge::~Bridge() {
+  delete m_NextRawSkeleton;
+  s_Instance = nullptr;
+}
 
 /// @brief Initialize the sample console and the SDK.
 /// This function attempts to resize the console window and then proceeds to
@@ -182,36 +202,23 @@ ClientReturnCode Bridge::RegisterAllCallbacks() {
   return ClientReturnCode::ClientReturnCode_Success;
 }
 
-/// @brief Poll for the latest skeleton data and write it to the provided buffer.
-/// This function retrieves the most recent skeleton data from the SDK callback
-/// and formats it into a flat array of ManusNodePose structures. The function
-/// is thread-safe and will swap the latest data from the callback thread.
+/// @brief Write all nodes of a skeleton collection into a flat buffer.
+/// The node info of each glove is requested from the SDK on first use and
+/// cached, so polling does not make an SDK call per skeleton. Must not be
+/// called with m_RawSkeletonMutex held, to keep the SDK callback unblocked.
+/// @param collection Skeleton data of one frame
 /// @param buffer Pointer to the output buffer for node poses
 /// @param buffer_size Maximum number of nodes the buffer can hold
-/// @param count Output parameter set to the number of nodes written to the buffer
-void Bridge::Poll(ManusNodePose *buffer, uint32_t buffer_size,
-                  uint32_t &count) {
-  m_RawSkeletonMutex.lock();
-
-  // Swap in the latest skeleton data from the callback thread
-  delete m_RawSkeleton;
-  m_RawSkeleton = m_NextRawSkeleton;
-  m_NextRawSkeleton = nullptr;
-
-  count = 0; // Initialize count to zero
-  
-  // Check if we have valid skeleton data
-  if (!m_RawSkeleton || m_RawSkeleton->skeletons.size() == 0) {
-    m_RawSkeletonMutex.unlock();
-    return; // No data available yet
-  }
-
-  uint32_t t_SkeletonCount = m_RawSkeleton->skeletons.size();
+/// @return The number of nodes written to the buffer
+uint32_t Bridge::WriteSkeletonCollection(
+    const ClientRawSkeletonCollection &collection, ManusNodePose *buffer,
+    uint32_t buffer_size) {
+  uint32_t t_SkeletonCount = collection.skeletons.size();
   uint32_t buffer_index = 0;
 
   for (uint32_t i = 0; i < t_SkeletonCount; i++) {
-    uint32_t t_GloveId = m_RawSkeleton->skeletons[i].info.gloveId;
-    uint32_t t_NodeCount = m_RawSkeleton->skeletons[i].info.nodesCount;
+    uint32_t t_GloveId = collection.skeletons[i].info.gloveId;
+    uint32_t t_NodeCount = collection.skeletons[i].info.nodesCount;
     
     // Check if we have enough buffer space
     if (buffer_index + t_NodeCount > buffer_size) {
@@ -220,15 +227,22 @@ void Bridge::Poll(ManusNodePose *buffer, uint32_t buffer_size,
       break;
     }
     
-    NodeInfo node_info[t_NodeCount];
-    SDKReturnCode result = CoreSdk_GetRawSkeletonNodeInfoArray(t_GloveId, node_info, t_NodeCount);
-    if (result != SDKReturnCode::SDKReturnCode_Success) {
-      ClientLog::error("Failed to get node info array for glove {}", t_GloveId);
-      continue;
+    std::lock_guard<std::mutex> t_NodeInfoLock(m_NodeInfoMutex);
+    std::vector<NodeInfo> &node_info = m_NodeInfoCache[t_GloveId];
+    // Fetch the node info again if the glove reports a different skeleton
+    if (node_info.size() != t_NodeCount) {
+      node_info.resize(t_NodeCount);
+      SDKReturnCode result = CoreSdk_GetRawSkeletonNodeInfoArray(
+          t_GloveId, node_info.data(), t_NodeCount);
+      if (result != SDKReturnCode::SDKReturnCode_Success) {
+        ClientLog::error("Failed to get node info array for glove {}", t_GloveId);
+        m_NodeInfoCache.erase(t_GloveId);
+        continue;
+      }
     }
 
     for (uint32_t j = 0; j < t_NodeCount; j++) {
-      const SkeletonNode& node = m_RawSkeleton->skeletons[i].nodes[j];
+      const SkeletonNode& node = collection.skeletons[i].nodes[j];
       ManusNodePose &node_pose = buffer[buffer_index++];
       node_pose.glove_id = t_GloveId;
       node_pose.node_id = node_info[j].nodeId;
@@ -237,12 +251,71 @@ void Bridge::Poll(ManusNodePose *buffer, uint32_t buffer_size,
       node_pose.orientation = node.transform.rotation;
     }
   }
-  
-  count = buffer_index; // Set the actual number of nodes written
 
-  m_RawSkeletonMutex.unlock();
+  return buffer_index;
+}
+
+/// @brief Poll for the latest skeleton data and write it to the provided buffer.
+/// This function retrieves the most recent skeleton data from the SDK callback
+/// and formats it into a flat array of ManusNodePose structures. Each frame is
+/// returned by at most one poll. The function is thread-safe.
+/// @param buffer Pointer to the output buffer for node poses
+/// @param buffer_size Maximum number of nodes the buffer can hold
+/// @param count Output parameter set to the number of nodes written to the buffer
+void Bridge::Poll(ManusNodePose *buffer, uint32_t buffer_size,
+                  uint32_t &count) {
+  // Take the latest skeleton data from the callback thread, and convert it
+  // after releasing the lock
+  std::unique_ptr<ClientRawSkeletonCollection> t_Latest;
+  {
+    std::lock_guard<std::mutex> t_Lock(m_RawSkeletonMutex);
+    t_Latest.reset(m_NextRawSkeleton);
+    m_NextRawSkeleton = nullptr;
+  }
+
+  count = 0; // Initialize count to zero
+
+  // Check if we have valid skeleton data
+  if (!t_Latest) {
+    return; // No data available yet
+  }
+
+  count = WriteSkeletonCollection(*t_Latest, buffer, buffer_size);
 }
 
+/// @brief Poll for the latest skeleton data and write it to separate arrays.
+/// Same as Poll, but node ids, sides, positions (x, y, z) and orientations
+/// (w, x, y, z) are each written to their own contiguous array, so consumers
+/// can read a single field without striding over whole node poses. The
+/// function is thread-safe.
+/// @param node_ids Output array of buffer_size node ids
+/// @param sides Output array of buffer_size glove sides
+/// @param positions Output array of buffer_size * 3 position components
+/// @param orientations Output array of buffer_size * 4 quaternion components
+/// @param buffer_size Maximum number of nodes the arrays can hold
+/// @param count Output parameter set to the number of nodes written
+void Bridge::PollSoa(int32_t *node_ids, int32_t *sides, float *positions,
+                     float *orientations, uint32_t buffer_size,
+                     uint32_t &count) {
+  // Per-thread scratch buffer, so concurrent callers never share (or resize)
+  // the buffer another caller is reading from
+  thread_local std::vector<ManusNodePose> t_Scratch;
+  t_Scratch.resize(buffer_size);
+  Poll(t_Scratch.data(), buffer_size, count);
+
+  for (uint32_t i = 0; i < count; i++) {
+    const ManusNodePose &node_pose = t_Scratch[i];
+    node_ids[i] = static_cast<int32_t>(node_pose.node_id);
+    sides[i] = static_cast<int32_t>(node_pose.side);
+    positions[3 * i + 0] = node_pose.position.x;
+    positions[3 * i + 1] = node_pose.position.y;
+    positions[3 * i + 2] = node_pose.position.z;
+    orientations[4 * i + 0] = node_pose.orientation.w;
+    orientations[4 * i + 1] = node_pose.orientation.x;
+    orientations[4 * i + 2] = node_pose.orientation.y;
+    orientations[4 * i + 3] = node_pose.orientation.z;
+  }
+}
 
 /// @brief the client will now try to connect to MANUS Core via the SDK when the
 /// ConnectionType is not integrated. These steps still need to be followed when
@@ -3,7 +3,9 @@
 
 #include "ClientPlatformSpecific.hpp"
 #include "ManusSDK.h"
+#include <memory>
 #include <mutex>
+#include <unordered_map>
 #include <vector>
 
 /// @brief The type of connection to core.
@@ -51,6 +53,8 @@ class Bridge;
 
 Bridge* bridge_create();
 int poll(ManusNodePose *buffer, uint32_t buffer_size, uint32_t *count);
+int poll_soa(int32_t *node_ids, int32_t *sides, float *positions,
+             float *orientations, uint32_t buffer_size, uint32_t *count);
 int shutdown();
 
 #ifdef __cplusplus
@@ -83,6 +87,8 @@ public:
   ClientReturnCode RegisterAllCallbacks();
   ClientReturnCode ShutDown();
   void Poll(ManusNodePose *buffer, uint32_t buffer_size, uint32_t &count);
+  void PollSoa(int32_t *node_ids, int32_t *sides, float *positions,
+               float *orientations, uint32_t buffer_size, uint32_t &count);
 
   void PrintRawSkeletonNodeInfo();
 
@@ -91,14 +97,23 @@ public:
 
 protected:
   ClientReturnCode Connect();
+  uint32_t WriteSkeletonCollection(const ClientRawSkeletonCollection &collection,
+                                   ManusNodePose *buffer, uint32_t buffer_size);
 
   bool m_PrintedNodeInfo = false;
 
   ConnectionType m_ConnectionType = ConnectionType::ConnectionType_Remote;
 
   std::mutex m_RawSkeletonMutex;
+  /// @brief Latest frame received since the last poll, owned by the bridge.
   ClientRawSkeletonCollection *m_NextRawSkeleton = nullptr;
-  ClientRawSkeletonCollection *m_RawSkeleton = nullptr;
+
+  /// @brief Guards m_NodeInfoCache. Only taken by polling threads, never by
+  /// the SDK callback thread.
+  std::mutex m_NodeInfoMutex;
+  /// @brief Node info (node ids and sides) per glove id, fetched from the SDK
+  /// once per glove and skeleton layout.
+  std::unordered_map<uint32_t, std::vector<NodeInfo>> m_NodeInfoCache;
 
   uint32_t m_FrameCounter = 0;
 };
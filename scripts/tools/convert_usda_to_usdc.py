@@ -0,0 +1,62 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This script converts ASCII USD files (``.usda``) to binary crate files (``.usdc``) next to them.
+
+Crate files are memory-mapped on load instead of parsed, which speeds up scene creation. The scene configuration
+in ``environments/pretty_env_cfg.py`` picks up a crate file automatically when it is at least as new as its
+``.usda`` source. Only the root layer is exported, so references and sublayers are kept as they are and resolve
+relative to the same directory.
+
+Usage (converts the scene assets if no files are given):
+
+```bash
+./isaaclab.sh -p scripts/tools/convert_usda_to_usdc.py [<Usda-Path> ...] [--force]
+```
+
+"""
+
+import argparse
+import os
+
+from pxr import Sdf
+
+# Scene assets referenced by the Nine Linked Rings environment, relative to the repository root
+SCENE_ASSETS = [
+    "assets/ground_plane/ground_plane.usda",
+    "assets/nine_linked_rings/nine_linked_rings.usda",
+]
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Convert ASCII USD files to binary crate files.")
+parser.add_argument("input", type=str, nargs="*", help="The paths to the .usda files. Defaults to the scene assets.")
+parser.add_argument("--force", action="store_true", default=False, help="Convert files that are already up to date.")
+args_cli = parser.parse_args()
+
+
+def main():
+    """Convert every given file whose crate file is missing or older than the source."""
+    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    usda_paths = args_cli.input or [os.path.join(repo_root, path) for path in SCENE_ASSETS]
+
+    for usda_path in usda_paths:
+        usdc_path = os.path.splitext(usda_path)[0] + ".usdc"
+        if not os.path.isfile(usda_path):
+            print(f"[SKIP] File not found: {usda_path}")
+            continue
+        if not args_cli.force and os.path.isfile(usdc_path):
+            if os.path.getmtime(usdc_path) >= os.path.getmtime(usda_path):
+                print(f"[SKIP] Up to date: {usdc_path}")
+                continue
+
+        layer = Sdf.Layer.FindOrOpen(usda_path)
+        if not layer or not layer.Export(usdc_path):
+            raise RuntimeError(f"Failed to convert {usda_path} to {usdc_path}")
+        print(f"[INFO] Converted: {usda_path} -> {usdc_path}")
+
+
+if __name__ == "__main__":
+    main()
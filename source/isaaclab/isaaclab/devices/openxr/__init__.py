@@ -5,6 +5,6 @@
 
 """Keyboard device for SE(2) and SE(3) control."""
 
-from .manus_vive import ManusVive, ManusViveCfg
+from .manus_vive import ManusVive, ManusViveCfg, RawHandFrame
 from .openxr_device import OpenXRDevice, OpenXRDeviceCfg
 from .xr_cfg import XrCfg, remove_camera_configs
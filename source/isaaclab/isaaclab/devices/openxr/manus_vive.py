@@ -42,6 +42,41 @@ class ManusViveCfg(DeviceCfg):
     xr_cfg: XrCfg | None = None
 
 
+@dataclass(slots=True)
+class RawHandFrame:
+    """Tracking data of one device update in preallocated arrays.
+
+    Poses are 7-element arrays [x, y, z, qw, qx, qy, qz]. Hand joints are ordered as in
+    :data:`~isaaclab.devices.openxr.common.HAND_JOINT_NAMES`.
+    """
+
+    left_hand: np.ndarray
+    """Joint poses of the left hand. Shape is (num_joints, 7)."""
+
+    right_hand: np.ndarray
+    """Joint poses of the right hand. Shape is (num_joints, 7)."""
+
+    head: np.ndarray
+    """Head pose. Shape is (7,)."""
+
+    @classmethod
+    def empty(cls) -> "RawHandFrame":
+        """Allocate a frame with uninitialized poses."""
+        num_joints = len(HAND_JOINT_NAMES)
+        return cls(
+            left_hand=np.empty((num_joints, 7), dtype=np.float32),
+            right_hand=np.empty((num_joints, 7), dtype=np.float32),
+            head=np.empty(7, dtype=np.float32),
+        )
+
+    def as_dict(self) -> dict[str, np.ndarray]:
+        """Views of the pose arrays keyed by field name.
+
+        The views remain valid while the frame is refilled, so the dictionary can be created once and reused.
+        """
+        return {"left_hand": self.left_hand, "right_hand": self.right_hand, "head": self.head}
+
+
 class ManusVive(DeviceBase):
     """Manus gloves and Vive trackers for teleoperation and interaction.
 
@@ -57,7 +92,8 @@ class ManusVive(DeviceBase):
     * Hand joints calculated from Vive wrist joints and Manus hand joints (relative to wrist).
     * Vive trackers are automatically mapped to the left and right wrist joints.
 
-    Raw data format (_get_raw_data output): consistent with :class:`OpenXRDevice`.
+    Raw data format (_get_raw_data output): consistent with :class:`OpenXRDevice`. :meth:`fill_raw_data` copies the
+    same data into a preallocated :class:`RawHandFrame` instead, e.g. for recording it every step.
     Joint names are defined in `HAND_JOINT_MAP` from `isaaclab.devices.openxr.manus_vive_utils`.
 
     Teleop commands: consistent with :class:`OpenXRDevice`.
@@ -191,18 +227,34 @@ class ManusVive(DeviceBase):
         Each pose is represented as a 7-element array: [x, y, z, qw, qx, qy, qz]
         where the first 3 elements are position and the last 4 are quaternion orientation.
         """
-        hand_tracking_data = self._manus_vive.get_all_device_data()["manus_gloves"]
-        result = {"left": self._previous_joint_poses_left, "right": self._previous_joint_poses_right}
-        for joint, pose in hand_tracking_data.items():
-            hand, index = joint.split("_")
-            joint_name = HAND_JOINT_MAP[int(index)]
-            result[hand][joint_name] = np.array(pose["position"] + pose["orientation"], dtype=np.float32)
+        node_ids, sides, positions, orientations = self._manus_vive.poll_soa()
+        # Views into the bridge buffers are consumed here, before the next poll
+        poses = np.concatenate((positions, orientations), axis=1)
+        # Side enum: 1 = left, 2 = right
+        for side, joint_poses in ((1, self._previous_joint_poses_left), (2, self._previous_joint_poses_right)):
+            mask = sides == side
+            for node_id, pose in zip(node_ids[mask].tolist(), poses[mask]):
+                joint_poses[HAND_JOINT_MAP[node_id]] = pose
         return {
-            OpenXRDevice.TrackingTarget.HAND_LEFT: result["left"],
-            OpenXRDevice.TrackingTarget.HAND_RIGHT: result["right"],
+            OpenXRDevice.TrackingTarget.HAND_LEFT: self._previous_joint_poses_left,
+            OpenXRDevice.TrackingTarget.HAND_RIGHT: self._previous_joint_poses_right,
             OpenXRDevice.TrackingTarget.HEAD: self._calculate_headpose(),
         }
 
+    def fill_raw_data(self, frame: RawHandFrame) -> None:
+        """Copy the tracking data of the latest update into a preallocated frame.
+
+        Unlike :meth:`_get_raw_data`, this does not poll the device again, so the frame matches the data the last
+        command (from :meth:`advance`) was computed from. No arrays are allocated, so it can be called every step.
+
+        Args:
+            frame: Frame to fill in place.
+        """
+        # The joint pose dictionaries are created in HAND_JOINT_NAMES order and only updated in place
+        np.stack(tuple(self._previous_joint_poses_left.values()), out=frame.left_hand)
+        np.stack(tuple(self._previous_joint_poses_right.values()), out=frame.right_hand)
+        frame.head[:] = self._previous_headpose
+
     def _calculate_headpose(self) -> np.ndarray:
         """Calculate the head pose from OpenXR.
 
@@ -1,8 +1,41 @@
 """Python wrapper for a custom manus IsaacLab bridge."""
 
 import ctypes
+import numpy as np
+import os
 from typing import Dict, List
 
+import omni.log
+
+# Glove side enum of the bridge (0 = invalid, 1 = left, 2 = right) to the prefix used in node keys
+_SIDE_LUT = ("unknown", "left", "right")
+
+
+class NodePose:
+    """Pose of a single Manus node.
+
+    Uses ``__slots__`` so that each node costs a single small object instead of a dictionary. Item access
+    (``pose["position"]``) is supported for code written against the previous dictionary format.
+
+    Attributes:
+        position: Node position [x, y, z].
+        orientation: Node orientation [w, x, y, z].
+    """
+
+    __slots__ = ("position", "orientation")
+
+    def __init__(self, position: List[float], orientation: List[float]):
+        self.position = position
+        self.orientation = orientation
+
+    def __getitem__(self, key: str) -> List[float]:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self) -> str:
+        return f"NodePose(position={self.position}, orientation={self.orientation})"
+
 
 class ManusViveIntegration:
     """Python interface to the Manus Vive SDK bridge for IsaacLab.
@@ -15,11 +48,25 @@ class ManusViveIntegration:
     Attributes:
         _bridge_lib: The loaded shared library handle.
         _pose_buffer: Pre-allocated buffer for receiving pose data.
+        _np_view: Structured numpy view onto ``_pose_buffer`` (no copy).
         _MAX_NUM_NODES: Maximum number of nodes (joints) that can be tracked.
     """
-    def __init__(self):
-        # Load the shared library
-        self._bridge_lib = ctypes.CDLL("libmanus-vive-isaaclab-bridge.so")
+    def __init__(self, max_nodes: int = 64):
+        """Initialize the Manus integration.
+
+        Args:
+            max_nodes: Maximum number of nodes (joints) read per poll. Two gloves with 22 nodes each need 44, so the
+                default of 64 keeps the pose buffers small enough to stay cache-resident. Gloves reporting more nodes
+                than this are dropped by the bridge with a buffer overflow error.
+
+        Raises:
+            ValueError: If ``max_nodes`` is not positive.
+        """
+        if max_nodes <= 0:
+            raise ValueError(f"max_nodes must be positive, got {max_nodes}")
+
+        # Load the shared library, resolving all symbols at load time instead of on the first poll
+        self._bridge_lib = ctypes.CDLL("libmanus-vive-isaaclab-bridge.so", mode=os.RTLD_NOW | os.RTLD_LOCAL)
         
         # Define structures to match C++ layout
         class _ManusVec3(ctypes.Structure):
@@ -47,9 +94,48 @@ class ManusViveIntegration:
             ]
 
         self._ManusNodePose = _ManusNodePose
-        self._MAX_NUM_NODES = 512
+        self._MAX_NUM_NODES = max_nodes
         self._pose_buffer = (_ManusNodePose * self._MAX_NUM_NODES)()
-        
+
+        # Structured numpy dtype mirroring the ctypes layout, used to decode the buffer without
+        # per-node attribute access
+        self._np_dtype = np.dtype(
+            [
+                ("glove_id", np.uint32),
+                ("node_id", np.uint32),
+                ("side", np.uint32),
+                ("position", np.float32, (3,)),
+                ("orientation", np.float32, (4,)),
+            ],
+            align=True,
+        )
+        if ctypes.sizeof(_ManusNodePose) != self._np_dtype.itemsize:
+            raise RuntimeError(
+                f"Manus node pose layout mismatch: ctypes size {ctypes.sizeof(_ManusNodePose)} bytes,"
+                f" numpy size {self._np_dtype.itemsize} bytes"
+            )
+        self._np_view = np.frombuffer(self._pose_buffer, dtype=self._np_dtype)
+
+        # Separate per-field arrays for polling in structure-of-arrays layout
+        self._soa_node_ids = np.empty(self._MAX_NUM_NODES, dtype=np.int32)
+        self._soa_sides = np.empty(self._MAX_NUM_NODES, dtype=np.int32)
+        self._soa_positions = np.empty((self._MAX_NUM_NODES, 3), dtype=np.float32)
+        self._soa_orientations = np.empty((self._MAX_NUM_NODES, 4), dtype=np.float32)
+        self._soa_ptrs = (
+            self._soa_node_ids.ctypes.data_as(ctypes.POINTER(ctypes.c_int32)),
+            self._soa_sides.ctypes.data_as(ctypes.POINTER(ctypes.c_int32)),
+            self._soa_positions.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+            self._soa_orientations.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+        )
+
+        # Node keys ("{side}_{node_id}") per observed (side, node_id) pair, since the same nodes are polled every frame
+        self._key_cache: Dict[tuple[int, int], str] = {}
+
+        # Poll arguments are created once and reused on every call
+        self._pose_buffer_ptr = ctypes.cast(self._pose_buffer, ctypes.POINTER(_ManusNodePose))
+        self._count_cell = ctypes.c_uint32(0)
+        self._count_ref = ctypes.byref(self._count_cell)
+
         # Define C function signatures
         # bridge_create() -> Bridge*
         self._bridge_lib.bridge_create.argtypes = []
@@ -63,6 +149,27 @@ class ManusViveIntegration:
         ]
         self._bridge_lib.poll.restype = ctypes.c_int
         
+        # poll_soa is missing from bridge libraries built before it was added. In that case poll_soa() falls
+        # back to the poll above until the bridge is rebuilt.
+        self._has_poll_soa = hasattr(self._bridge_lib, "poll_soa")
+        if not self._has_poll_soa:
+            omni.log.warn(
+                "Manus Vive bridge library predates poll_soa, falling back to poll. Rebuild the bridge to enable it."
+            )
+
+        # poll_soa(int32_t* node_ids, int32_t* sides, float* positions, float* orientations,
+        #          uint32_t buffer_size, uint32_t* count) -> int
+        if self._has_poll_soa:
+            self._bridge_lib.poll_soa.argtypes = [
+                ctypes.POINTER(ctypes.c_int32),
+                ctypes.POINTER(ctypes.c_int32),
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.POINTER(ctypes.c_float),
+                ctypes.c_uint32,
+                ctypes.POINTER(ctypes.c_uint32),
+            ]
+            self._bridge_lib.poll_soa.restype = ctypes.c_int
+
         # shutdown() -> int
         self._bridge_lib.shutdown.argtypes = []
         self._bridge_lib.shutdown.restype = ctypes.c_int
@@ -79,10 +186,10 @@ class ManusViveIntegration:
             Manus glove joint data.
             {
                 'manus_gloves': {
-                    '{left/right}_{joint_index}': {
-                        'position': [x, y, z],
-                        'orientation': [w, x, y, z]
-                    },
+                    '{left/right}_{joint_index}': NodePose(
+                        position=[x, y, z],
+                        orientation=[w, x, y, z]
+                    ),
                     ...
                 }
             }
@@ -99,24 +206,69 @@ class ManusViveIntegration:
         Raises:
             RuntimeError: If polling fails with an error other than "no data" (-2).
         """
-        count = ctypes.c_uint32(0)
-        result = self._bridge_lib.poll(
-            self._pose_buffer, 
-            self._MAX_NUM_NODES, 
-            ctypes.byref(count)
+        self._count_cell.value = 0
+        result = self._bridge_lib.poll(self._pose_buffer_ptr, self._MAX_NUM_NODES, self._count_ref)
+        self._check_poll_result(result)
+
+        return self._count_cell.value
+
+    def poll_soa(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Poll the bridge for the latest skeleton data in structure-of-arrays layout.
+
+        Each field is written by the bridge into its own contiguous array, so filtering by one field
+        (e.g. ``positions[sides == 1]`` for the left glove) only reads that field's memory. The returned
+        arrays are views into internal buffers and are only valid until the next call to this method. With
+        a bridge library built without ``poll_soa``, the latest frame is polled into the interleaved pose
+        buffer and copied into the per-field arrays.
+
+        Returns:
+            A tuple containing:
+                - node_ids: Manus node ids. Shape is (N,), dtype int32.
+                - sides: Glove sides (1 = left, 2 = right, otherwise unknown). Shape is (N,), dtype int32.
+                - positions: Node positions (x, y, z). Shape is (N, 3), dtype float32.
+                - orientations: Node orientations (w, x, y, z). Shape is (N, 4), dtype float32.
+
+        Raises:
+            RuntimeError: If polling fails with an error other than "no data" (-2).
+        """
+        if self._has_poll_soa:
+            self._count_cell.value = 0
+            result = self._bridge_lib.poll_soa(*self._soa_ptrs, self._MAX_NUM_NODES, self._count_ref)
+            self._check_poll_result(result)
+            num_nodes = self._count_cell.value
+        else:
+            num_nodes = self.poll_current_bridge_data_into_buffer()
+            nodes = self._np_view[:num_nodes]
+            self._soa_node_ids[:num_nodes] = nodes["node_id"]
+            self._soa_sides[:num_nodes] = nodes["side"]
+            self._soa_positions[:num_nodes] = nodes["position"]
+            self._soa_orientations[:num_nodes] = nodes["orientation"]
+
+        return (
+            self._soa_node_ids[:num_nodes],
+            self._soa_sides[:num_nodes],
+            self._soa_positions[:num_nodes],
+            self._soa_orientations[:num_nodes],
         )
-        
-        # Return codes: 0 = success, -1 = not initialized, -2 = no data, -3 = invalid args
+
+    def _check_poll_result(self, result: int):
+        """Raise an error for failed bridge polls.
+
+        Args:
+            result: Return code of a bridge poll function.
+
+        Raises:
+            RuntimeError: If the return code is an error other than "no data" (-2).
+        """
+        # Return codes: >= 0 = success, -1 = not initialized, -2 = no data, -3 = invalid args
         if result == -1:
             raise RuntimeError("Manus Vive bridge not initialized")
         elif result == -3:
             raise RuntimeError("Invalid arguments passed to poll function")
-        elif result != 0 and result != -2:
+        elif result < 0 and result != -2:
             raise RuntimeError(f"Failed to poll Manus Vive bridge data (error code: {result})")
-            
-        return count.value
 
-    def map_buffer_data_to_dict(self, num_nodes: int) -> Dict[str, Dict[str, List[float]]]:
+    def map_buffer_data_to_dict(self, num_nodes: int) -> Dict[str, NodePose]:
         """Convert the internal buffer data to a dictionary format.
         
         Args:
@@ -125,33 +277,39 @@ class ManusViveIntegration:
         Returns:
             Dictionary mapping node keys to their pose data. Each node key is
             formatted as "{side}_{node_id}" where side is "left", "right", or "unknown".
-            Each pose contains "position" (x, y, z) and "orientation" (w, x, y, z).
+            Each :class:`NodePose` contains "position" (x, y, z) and "orientation" (w, x, y, z).
         """
-        mapped: Dict[str, Dict[str, List[float]]] = {}
-        
-        for idx in range(num_nodes):
-            pose = self._pose_buffer[idx]
-            
-            # Map side enum to string: 1 = left, 2 = right
-            if pose.side == 1:
-                side_prefix = "left"
-            elif pose.side == 2:
-                side_prefix = "right"
-            else:
-                side_prefix = "unknown"
-            
-            key = f"{side_prefix}_{pose.node_id}"
-            mapped[key] = {
-                "position": [pose.position.x, pose.position.y, pose.position.z],
-                "orientation": [
-                    pose.orientation.w,
-                    pose.orientation.x,
-                    pose.orientation.y,
-                    pose.orientation.z,
-                ],
-            }
-            
-        return mapped
+        nodes = self._np_view[:num_nodes]
+
+        keys = []
+        key_cache = self._key_cache
+        for side_node in zip(nodes["side"].tolist(), nodes["node_id"].tolist()):
+            key = key_cache.get(side_node)
+            if key is None:
+                key = key_cache[side_node] = self._format_node_key(*side_node)
+            keys.append(key)
+
+        # Convert all poses at once instead of boxing each ctypes field separately
+        positions = nodes["position"].tolist()
+        orientations = nodes["orientation"].tolist()
+
+        return {
+            key: NodePose(position, orientation) for key, position, orientation in zip(keys, positions, orientations)
+        }
+
+    @staticmethod
+    def _format_node_key(side: int, node_id: int) -> str:
+        """Format the dictionary key of a node.
+
+        Args:
+            side: Side enum of the glove (1 = left, 2 = right).
+            node_id: Manus node id.
+
+        Returns:
+            Key formatted as "{side}_{node_id}" where side is "left", "right", or "unknown".
+        """
+        side_prefix = _SIDE_LUT[side] if 0 <= side < len(_SIDE_LUT) else "unknown"
+        return f"{side_prefix}_{node_id}"
 
     def shutdown(self):
         """Shutdown the Manus Vive bridge and disconnect from the SDK.
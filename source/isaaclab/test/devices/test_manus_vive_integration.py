@@ -0,0 +1,106 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+
+import pytest
+
+from isaaclab.devices.openxr.manus_vive_integration import ManusViveIntegration, NodePose
+
+# Nodes reported by the fake bridge: (glove_id, node_id, side, position, orientation)
+NODES = [
+    (7, 0, 1, (0.1, 0.2, 0.3), (1.0, 0.0, 0.0, 0.0)),
+    (7, 4, 1, (0.4, 0.5, 0.6), (0.0, 1.0, 0.0, 0.0)),
+    (8, 0, 2, (-0.1, -0.2, -0.3), (0.0, 0.0, 1.0, 0.0)),
+    (9, 2, 5, (1.0, 2.0, 3.0), (0.0, 0.0, 0.0, 1.0)),
+]
+
+
+@pytest.fixture
+def bridge_lib(mocker):
+    """Fake bridge library built before ``poll_batch`` and ``poll_soa`` were added."""
+    lib = mocker.MagicMock(spec=["bridge_create", "poll", "shutdown"])
+    lib.bridge_create.return_value = 1
+    lib.shutdown.return_value = 0
+
+    def poll(buffer, buffer_size, count):
+        for i, (glove_id, node_id, side, position, orientation) in enumerate(NODES):
+            buffer[i].glove_id = glove_id
+            buffer[i].node_id = node_id
+            buffer[i].side = side
+            buffer[i].position.x, buffer[i].position.y, buffer[i].position.z = position
+            buffer[i].orientation.w, buffer[i].orientation.x, buffer[i].orientation.y, buffer[i].orientation.z = (
+                orientation
+            )
+        count._obj.value = len(NODES)
+        return 0
+
+    lib.poll.side_effect = poll
+    mocker.patch("ctypes.CDLL", return_value=lib)
+    return lib
+
+
+def test_get_all_device_data(bridge_lib):
+    """Test that polled nodes are keyed by glove side and node id."""
+    integration = ManusViveIntegration(max_nodes=8)
+    gloves = integration.get_all_device_data()["manus_gloves"]
+
+    assert list(gloves) == ["left_0", "left_4", "right_0", "unknown_2"]
+    for pose, (_, _, _, position, orientation) in zip(gloves.values(), NODES):
+        assert isinstance(pose, NodePose)
+        np.testing.assert_allclose(pose.position, position, rtol=1e-6)
+        np.testing.assert_allclose(pose.orientation, orientation, rtol=1e-6)
+        # item access of the previous dictionary format
+        assert pose["position"] == pose.position
+        assert pose["orientation"] == pose.orientation
+    with pytest.raises(KeyError):
+        gloves["left_0"]["velocity"]
+
+
+def test_poll_soa_fallback(bridge_lib):
+    """Test that poll_soa falls back to poll for bridge libraries without poll_soa."""
+    integration = ManusViveIntegration(max_nodes=8)
+    node_ids, sides, positions, orientations = integration.poll_soa()
+
+    bridge_lib.poll.assert_called_once()
+    np.testing.assert_array_equal(node_ids, [node[1] for node in NODES])
+    np.testing.assert_array_equal(sides, [node[2] for node in NODES])
+    np.testing.assert_allclose(positions, [node[3] for node in NODES], rtol=1e-6)
+    np.testing.assert_allclose(orientations, [node[4] for node in NODES], rtol=1e-6)
+
+
+def test_poll_errors(bridge_lib):
+    """Test that failed polls raise, except when no data is available."""
+    integration = ManusViveIntegration(max_nodes=8)
+
+    bridge_lib.poll.side_effect = None
+    bridge_lib.poll.return_value = -2
+    assert integration.get_all_device_data() == {"manus_gloves": {}}
+    for result in (-1, -3, -4):
+        bridge_lib.poll.return_value = result
+        with pytest.raises(RuntimeError):
+            integration.poll_soa()
+
+
+def test_invalid_max_nodes(bridge_lib):
+    """Test that a non-positive node count is rejected."""
+    with pytest.raises(ValueError):
+        ManusViveIntegration(max_nodes=0)
+
+
+def test_bridge_create_failure(bridge_lib):
+    """Test that a failed bridge creation raises."""
+    bridge_lib.bridge_create.return_value = None
+    with pytest.raises(RuntimeError):
+        ManusViveIntegration()
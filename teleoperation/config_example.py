@@ -7,102 +7,62 @@ The Inspire hand has 19 DOF (7 arm + 12 hand joints) providing full dexterous co
 from teleoperation.retargeters.manus_vive_inspire_retargeter_cfg import ManusViveInspireRetargeterCfg
 
 # ==============================================================================
-# Example 1: Default Configuration
-# ==============================================================================
-# Balanced settings for general teleoperation
-
-default_cfg = ManusViveInspireRetargeterCfg(
-    pos_scale=1.0,        # 1:1 hand position to robot position
-    rot_scale=1.0,        # 1:1 hand rotation to robot rotation
-    finger_scale=1.0,     # 1:1 finger joint mapping
-    smoothing=0.3,        # Moderate smoothing for natural movement
-)
-
-# ==============================================================================
-# Example 2: High Sensitivity, Low Smoothing
-# ==============================================================================
-# For fast, responsive control. Good for quick manipulation tasks.
-# Trade-off: Less smooth, may be jittery
-
-high_response_cfg = ManusViveInspireRetargeterCfg(
-    pos_scale=2.0,        # Amplify hand movements (small hand motion = large robot motion)
-    rot_scale=2.0,        # Amplify rotations
-    finger_scale=1.2,     # Slightly amplify finger movements
-    smoothing=0.1,        # Minimal smoothing for quick response
-)
-
-# ==============================================================================
-# Example 3: Low Sensitivity, High Smoothing
-# ==============================================================================
-# For precise, smooth control. Good for delicate tasks requiring fine control.
-# Trade-off: Slower response, but very stable
-
-smooth_cfg = ManusViveInspireRetargeterCfg(
-    pos_scale=0.5,        # Reduce sensitivity (large hand motion = small robot motion)
-    rot_scale=0.5,        # Reduce rotation sensitivity
-    finger_scale=1.0,     # Keep 1:1 finger mapping
-    smoothing=0.5,        # Heavy smoothing for very smooth movements
-)
-
-# ==============================================================================
-# Example 4: Fine Manipulation
-# ==============================================================================
-# Optimized for precision tasks like the Nine Linked Rings puzzle
-
-precision_cfg = ManusViveInspireRetargeterCfg(
-    pos_scale=0.7,        # Reduced for fine positioning
-    rot_scale=0.8,        # Slightly reduced for controlled orientation
-    finger_scale=1.0,     # Full finger control needed for ring manipulation
-    smoothing=0.4,        # Balanced smoothing to prevent tremors
-)
-
-# ==============================================================================
-# Example 5: Recording Demonstrations
-# ==============================================================================
-# Optimized for recording clean, reproducible demonstrations for IL/RL
-
-recording_cfg = ManusViveInspireRetargeterCfg(
-    pos_scale=1.0,        # Standard 1:1 mapping
-    rot_scale=1.0,        # Standard 1:1 mapping
-    finger_scale=1.0,     # Standard 1:1 mapping
-    smoothing=0.35,       # Slightly higher smoothing to remove noise
-)
-
-# ==============================================================================
-# Example 6: Testing/Debugging
-# ==============================================================================
-# Highly damped for safe testing of new setups
-
-safe_testing_cfg = ManusViveInspireRetargeterCfg(
-    pos_scale=0.3,        # Very low sensitivity
-    rot_scale=0.3,        # Very low sensitivity
-    finger_scale=0.5,     # Reduced finger motion for safety
-    smoothing=0.7,        # Heavy smoothing
-)
-
-# ==============================================================================
-# Example 7: Expert User
-# ==============================================================================
-# For experienced users who want direct, unfiltered control
-
-expert_cfg = ManusViveInspireRetargeterCfg(
-    pos_scale=1.5,        # Moderate amplification
-    rot_scale=1.5,        # Moderate amplification
-    finger_scale=1.3,     # Amplify finger motions for full range
-    smoothing=0.15,       # Minimal smoothing for direct feel
-)
-
-# ==============================================================================
-# Example 8: Large Workspace
-# ==============================================================================
-# When you need to cover a large robot workspace with limited hand movement
-
-large_workspace_cfg = ManusViveInspireRetargeterCfg(
-    pos_scale=3.0,        # High amplification for large motions
-    rot_scale=1.5,        # Moderate rotation amplification
-    finger_scale=1.0,     # Keep fingers 1:1
-    smoothing=0.25,       # Light smoothing to handle amplified noise
-)
+# Presets
+# ==============================================================================
+# Each preset only differs in four scalars, so they are kept in one table and
+# instantiated through make_retargeter_cfg().
+
+RETARGETER_PRESETS: dict[str, dict[str, float]] = {
+    # Example 1: Default Configuration
+    # Balanced settings for general teleoperation (1:1 mapping, moderate smoothing)
+    "default": dict(pos_scale=1.0, rot_scale=1.0, finger_scale=1.0, smoothing=0.3),
+    # Example 2: High Sensitivity, Low Smoothing
+    # For fast, responsive control. Good for quick manipulation tasks.
+    # Trade-off: Less smooth, may be jittery
+    "high_response": dict(pos_scale=2.0, rot_scale=2.0, finger_scale=1.2, smoothing=0.1),
+    # Example 3: Low Sensitivity, High Smoothing
+    # For precise, smooth control. Good for delicate tasks requiring fine control.
+    # Trade-off: Slower response, but very stable
+    "smooth": dict(pos_scale=0.5, rot_scale=0.5, finger_scale=1.0, smoothing=0.5),
+    # Example 4: Fine Manipulation
+    # Optimized for precision tasks like the Nine Linked Rings puzzle
+    "precision": dict(pos_scale=0.7, rot_scale=0.8, finger_scale=1.0, smoothing=0.4),
+    # Example 5: Recording Demonstrations
+    # Optimized for recording clean, reproducible demonstrations for IL/RL
+    "recording": dict(pos_scale=1.0, rot_scale=1.0, finger_scale=1.0, smoothing=0.35),
+    # Example 6: Testing/Debugging
+    # Highly damped for safe testing of new setups
+    "safe_testing": dict(pos_scale=0.3, rot_scale=0.3, finger_scale=0.5, smoothing=0.7),
+    # Example 7: Expert User
+    # For experienced users who want direct, unfiltered control
+    "expert": dict(pos_scale=1.5, rot_scale=1.5, finger_scale=1.3, smoothing=0.15),
+    # Example 8: Large Workspace
+    # When you need to cover a large robot workspace with limited hand movement
+    "large_workspace": dict(pos_scale=3.0, rot_scale=1.5, finger_scale=1.0, smoothing=0.25),
+}
+
+
+def make_retargeter_cfg(preset: str = "default", **overrides) -> ManusViveInspireRetargeterCfg:
+    """Create a new retargeter configuration from a preset.
+
+    Args:
+        preset: Name of the preset in :data:`RETARGETER_PRESETS`. Defaults to "default".
+        **overrides: Configuration fields that replace the preset values.
+
+    Returns:
+        A new configuration instance that can be modified without affecting the presets.
+    """
+    return ManusViveInspireRetargeterCfg(**{**RETARGETER_PRESETS[preset], **overrides})
+
+
+default_cfg = make_retargeter_cfg("default")
+high_response_cfg = make_retargeter_cfg("high_response")
+smooth_cfg = make_retargeter_cfg("smooth")
+precision_cfg = make_retargeter_cfg("precision")
+recording_cfg = make_retargeter_cfg("recording")
+safe_testing_cfg = make_retargeter_cfg("safe_testing")
+expert_cfg = make_retargeter_cfg("expert")
+large_workspace_cfg = make_retargeter_cfg("large_workspace")
 
 # ==============================================================================
 # How to Use
@@ -118,11 +78,10 @@ from teleoperation.config_example import precision_cfg  # Import desired config
 # Create retargeter with chosen configuration
 retargeter = ManusViveInspireRetargeter(precision_cfg)
 
-# Or override specific parameters
-from teleoperation.config_example import default_cfg
+# Or override specific parameters (creates a new config, the presets stay untouched)
+from teleoperation.config_example import make_retargeter_cfg
 
-custom_cfg = default_cfg
-custom_cfg.pos_scale = 1.5  # Modify just one parameter
+custom_cfg = make_retargeter_cfg("default", pos_scale=1.5)
 retargeter = ManusViveInspireRetargeter(custom_cfg)
 """
 
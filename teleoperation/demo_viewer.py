@@ -13,125 +13,199 @@ Updated to support both:
 
 import argparse
 from pathlib import Path
+from typing import Any
 
 import matplotlib.pyplot as plt
 import numpy as np
+from numba import njit
 
 from teleoperation.recording_utils import load_demonstration
 
+MAX_PLOT_POINTS = 2000
+"""Maximum number of points per plotted trajectory. Longer demonstrations are decimated before plotting."""
 
-def plot_demonstration(demo: dict, save_path: str | None = None) -> None:
+
+def _decimate(
+    timestamps: np.ndarray, actions: np.ndarray, target: int = MAX_PLOT_POINTS
+) -> tuple[np.ndarray, np.ndarray]:
+    """Decimate a demonstration by striding so that at most about ``target`` points are plotted per trajectory.
+
+    Args:
+        timestamps: Time array.
+        actions: Action array [N, D].
+        target: Number of points to keep.
+
+    Returns:
+        Strided views of the time and action arrays.
+    """
+    step = max(1, len(timestamps) // target)
+    return np.asarray(timestamps)[::step], actions[::step]
+
+
+@njit(cache=True)
+def _column_stats(values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the per-column minimum, maximum and mean of a 2-D array in a single pass.
+
+    Args:
+        values: Array [N, D].
+
+    Returns:
+        Tuple of the minimum, maximum and mean of each column, each of shape [D]. All values are NaN if N is 0.
+    """
+    num_rows, num_cols = values.shape
+    col_min = np.full(num_cols, np.nan)
+    col_max = np.full(num_cols, np.nan)
+    col_sum = np.zeros(num_cols, dtype=np.float64)
+    if num_rows == 0:
+        return col_min, col_max, np.full(num_cols, np.nan)
+    for j in range(num_cols):
+        col_min[j] = values[0, j]
+        col_max[j] = values[0, j]
+    for i in range(num_rows):
+        for j in range(num_cols):
+            value = values[i, j]
+            if value < col_min[j]:
+                col_min[j] = value
+            elif value > col_max[j]:
+                col_max[j] = value
+            col_sum[j] += value
+    return col_min, col_max, col_sum / num_rows
+
+
+def _print_keys(key: str, value: Any, indent: int) -> None:
+    """Print the key and shape of a recorded field, walking into dictionary fields.
+
+    Args:
+        key: Name of the field.
+        value: Array, or (nested) dictionary of arrays.
+        indent: Number of spaces before the entry.
+    """
+    if isinstance(value, dict):
+        print(f"{' ' * indent}- {key}:")
+        for child_key, child in value.items():
+            _print_keys(child_key, child, indent + 4)
+    else:
+        print(f"{' ' * indent}- {key}: shape={np.shape(value)}")
+
+
+def plot_demonstration(demo: dict, save_path: str | None = None, show: bool = True) -> None:
     """Plot visualization of a demonstration.
 
     Args:
         demo: Loaded demonstration dictionary.
         save_path: Optional path to save the plot.
+        show: Whether to show the plot in a window.
     """
     timestamps = demo["timestamps"]
-    actions = np.array(demo["actions"])
+    actions = np.asarray(demo["actions"])
     action_dim = actions.shape[-1]
 
     # Detect action format
     if action_dim == 19:
         # Inspire hand: 7 arm + 12 hand
-        plot_inspire_hand(timestamps, actions, save_path)
+        plot_inspire_hand(timestamps, actions, save_path, show)
     elif action_dim == 7:
         # Legacy Franka: 6 pose + 1 gripper
-        plot_franka_gripper(timestamps, actions, save_path)
+        plot_franka_gripper(timestamps, actions, save_path, show)
     else:
         print(f"Warning: Unknown action dimension {action_dim}. Plotting all dimensions.")
-        plot_generic_actions(timestamps, actions, save_path)
+        plot_generic_actions(timestamps, actions, save_path, show)
 
 
-def plot_inspire_hand(timestamps: np.ndarray, actions: np.ndarray, save_path: str | None = None) -> None:
+def plot_inspire_hand(
+    timestamps: np.ndarray, actions: np.ndarray, save_path: str | None = None, show: bool = True
+) -> None:
     """Plot Inspire hand demonstration (19 DOF).
 
     Args:
         timestamps: Time array.
         actions: Action array [N, 19].
         save_path: Optional path to save plot.
+        show: Whether to show the plot in a window.
     """
+    timestamps, actions = _decimate(timestamps, actions)
     fig, axes = plt.subplots(4, 1, figsize=(14, 12))
 
     # Arm joints (0:7)
     axes[0].set_title("Arm Joints (7 DOF)")
-    for i in range(7):
-        axes[0].plot(timestamps, actions[:, i], label=f"Joint {i+1}", linewidth=1.5)
+    lines = axes[0].plot(timestamps, actions[:, 0:7], linewidth=1.5, rasterized=True)
     axes[0].set_ylabel("Joint Position (rad)")
-    axes[0].legend(ncol=7, fontsize=8)
+    axes[0].legend(lines, [f"Joint {i+1}" for i in range(7)], ncol=7, fontsize=8)
     axes[0].grid(True, alpha=0.3)
 
     # Thumb joints (7:11)
     axes[1].set_title("Thumb (4 DOF: Yaw, Pitch, Intermediate, Distal)")
     thumb_labels = ["Yaw", "Pitch", "Intermediate", "Distal"]
-    for i, label in enumerate(thumb_labels):
-        axes[1].plot(timestamps, actions[:, 7+i], label=label, linewidth=2)
+    lines = axes[1].plot(timestamps, actions[:, 7:11], linewidth=2, rasterized=True)
     axes[1].set_ylabel("Joint Position (rad)")
-    axes[1].legend(ncol=4)
+    axes[1].legend(lines, thumb_labels, ncol=4)
     axes[1].grid(True, alpha=0.3)
 
     # Index and Middle fingers (11:15)
     axes[2].set_title("Index & Middle Fingers (2 DOF each: Proximal, Intermediate)")
     finger_labels = ["Index Prox", "Index Inter", "Middle Prox", "Middle Inter"]
     colors = ["#1f77b4", "#aec7e8", "#ff7f0e", "#ffbb78"]
-    for i, (label, color) in enumerate(zip(finger_labels, colors)):
-        axes[2].plot(timestamps, actions[:, 11+i], label=label, linewidth=2, color=color)
+    axes[2].set_prop_cycle(color=colors)
+    lines = axes[2].plot(timestamps, actions[:, 11:15], linewidth=2, rasterized=True)
     axes[2].set_ylabel("Joint Position (rad)")
-    axes[2].legend(ncol=4)
+    axes[2].legend(lines, finger_labels, ncol=4)
     axes[2].grid(True, alpha=0.3)
 
     # Ring and Pinky fingers (15:19)
     axes[3].set_title("Ring & Pinky Fingers (2 DOF each: Proximal, Intermediate)")
     finger_labels = ["Ring Prox", "Ring Inter", "Pinky Prox", "Pinky Inter"]
     colors = ["#2ca02c", "#98df8a", "#d62728", "#ff9896"]
-    for i, (label, color) in enumerate(zip(finger_labels, colors)):
-        axes[3].plot(timestamps, actions[:, 15+i], label=label, linewidth=2, color=color)
+    axes[3].set_prop_cycle(color=colors)
+    lines = axes[3].plot(timestamps, actions[:, 15:19], linewidth=2, rasterized=True)
     axes[3].set_ylabel("Joint Position (rad)")
     axes[3].set_xlabel("Time (s)")
-    axes[3].legend(ncol=4)
+    axes[3].legend(lines, finger_labels, ncol=4)
     axes[3].grid(True, alpha=0.3)
 
     plt.suptitle("Inspire Hand Demonstration (19 DOF)", fontsize=14, fontweight="bold")
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight")
+        plt.savefig(save_path, dpi=150, bbox_inches="tight")
         print(f"Plot saved to: {save_path}")
 
-    plt.show()
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
 
 
-def plot_franka_gripper(timestamps: np.ndarray, actions: np.ndarray, save_path: str | None = None) -> None:
+def plot_franka_gripper(
+    timestamps: np.ndarray, actions: np.ndarray, save_path: str | None = None, show: bool = True
+) -> None:
     """Plot Franka gripper demonstration (7 DOF).
 
     Args:
         timestamps: Time array.
         actions: Action array [N, 7].
         save_path: Optional path to save plot.
+        show: Whether to show the plot in a window.
     """
+    timestamps, actions = _decimate(timestamps, actions)
     fig, axes = plt.subplots(3, 1, figsize=(12, 10))
 
     # Plot position commands
     axes[0].set_title("Position Commands")
-    axes[0].plot(timestamps, actions[:, 0], label="X", linewidth=2)
-    axes[0].plot(timestamps, actions[:, 1], label="Y", linewidth=2)
-    axes[0].plot(timestamps, actions[:, 2], label="Z", linewidth=2)
+    lines = axes[0].plot(timestamps, actions[:, 0:3], linewidth=2, rasterized=True)
     axes[0].set_ylabel("Position (m)")
-    axes[0].legend()
+    axes[0].legend(lines, ["X", "Y", "Z"])
     axes[0].grid(True, alpha=0.3)
 
     # Plot rotation commands
     axes[1].set_title("Rotation Commands")
-    axes[1].plot(timestamps, actions[:, 3], label="Roll", linewidth=2)
-    axes[1].plot(timestamps, actions[:, 4], label="Pitch", linewidth=2)
-    axes[1].plot(timestamps, actions[:, 5], label="Yaw", linewidth=2)
+    lines = axes[1].plot(timestamps, actions[:, 3:6], linewidth=2, rasterized=True)
     axes[1].set_ylabel("Rotation (rad)")
-    axes[1].legend()
+    axes[1].legend(lines, ["Roll", "Pitch", "Yaw"])
     axes[1].grid(True, alpha=0.3)
 
     # Plot gripper commands
     axes[2].set_title("Gripper Commands")
-    axes[2].plot(timestamps, actions[:, 6], label="Gripper", linewidth=2, color="purple")
+    axes[2].plot(timestamps, actions[:, 6], label="Gripper", linewidth=2, color="purple", rasterized=True)
     axes[2].set_ylabel("Gripper State (0=closed, 1=open)")
     axes[2].set_xlabel("Time (s)")
     axes[2].legend()
@@ -141,39 +215,48 @@ def plot_franka_gripper(timestamps: np.ndarray, actions: np.ndarray, save_path:
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight")
+        plt.savefig(save_path, dpi=150, bbox_inches="tight")
         print(f"Plot saved to: {save_path}")
 
-    plt.show()
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
 
 
-def plot_generic_actions(timestamps: np.ndarray, actions: np.ndarray, save_path: str | None = None) -> None:
+def plot_generic_actions(
+    timestamps: np.ndarray, actions: np.ndarray, save_path: str | None = None, show: bool = True
+) -> None:
     """Plot generic actions (any dimension).
 
     Args:
         timestamps: Time array.
         actions: Action array [N, D].
         save_path: Optional path to save plot.
+        show: Whether to show the plot in a window.
     """
+    timestamps, actions = _decimate(timestamps, actions)
     action_dim = actions.shape[-1]
     fig, ax = plt.subplots(1, 1, figsize=(14, 6))
 
-    for i in range(action_dim):
-        ax.plot(timestamps, actions[:, i], label=f"Action {i}", linewidth=1.5, alpha=0.7)
+    lines = ax.plot(timestamps, actions, linewidth=1.5, alpha=0.7, rasterized=True)
 
     ax.set_title(f"Action Trajectories ({action_dim} DOF)")
     ax.set_ylabel("Action Value")
     ax.set_xlabel("Time (s)")
-    ax.legend(ncol=min(10, action_dim), fontsize=8)
+    ax.legend(lines, [f"Action {i}" for i in range(action_dim)], ncol=min(10, action_dim), fontsize=8)
     ax.grid(True, alpha=0.3)
 
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight")
+        plt.savefig(save_path, dpi=150, bbox_inches="tight")
         print(f"Plot saved to: {save_path}")
 
-    plt.show()
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
 
 
 def print_demo_stats(demo: dict) -> None:
@@ -194,9 +277,16 @@ def print_demo_stats(demo: dict) -> None:
     print(f"  Total Steps:    {metadata['num_steps']}")
     print(f"  Average Rate:   {metadata['num_steps'] / metadata['duration_seconds']:.1f} Hz")
 
-    actions = np.array(demo["actions"])
+    actions = np.asarray(demo["actions"])
+    if len(actions) == 0:
+        print("\nNo actions recorded.")
+        print("\n" + "=" * 60 + "\n")
+        return
     action_dim = actions.shape[-1]
 
+    # Per-joint reductions in a single pass over the actions
+    action_min, action_max, action_mean = _column_stats(actions)
+
     print(f"\nAction Format:")
     if action_dim == 19:
         print(f"  Type: Inspire Hand (19 DOF)")
@@ -206,18 +296,18 @@ def print_demo_stats(demo: dict) -> None:
         
         print(f"\n  Arm Joint Range:")
         for i in range(7):
-            print(f"    Joint {i+1}: [{actions[:, i].min():.3f}, {actions[:, i].max():.3f}]")
+            print(f"    Joint {i+1}: [{action_min[i]:.3f}, {action_max[i]:.3f}]")
         
         print(f"\n  Thumb Joint Range:")
         thumb_names = ["Yaw", "Pitch", "Intermediate", "Distal"]
         for i, name in enumerate(thumb_names):
-            print(f"    {name}: [{actions[:, 7+i].min():.3f}, {actions[:, 7+i].max():.3f}]")
+            print(f"    {name}: [{action_min[7+i]:.3f}, {action_max[7+i]:.3f}]")
         
         print(f"\n  Finger Joint Range:")
         finger_names = ["Index Prox", "Index Inter", "Middle Prox", "Middle Inter",
                        "Ring Prox", "Ring Inter", "Pinky Prox", "Pinky Inter"]
         for i, name in enumerate(finger_names):
-            print(f"    {name}: [{actions[:, 11+i].min():.3f}, {actions[:, 11+i].max():.3f}]")
+            print(f"    {name}: [{action_min[11+i]:.3f}, {action_max[11+i]:.3f}]")
     
     elif action_dim == 7:
         print(f"  Type: Franka Gripper (7 DOF)")
@@ -226,25 +316,25 @@ def print_demo_stats(demo: dict) -> None:
         print(f"    - Gripper: 1 DOF")
         
         print(f"\n  Position Range:")
-        print(f"    X: [{actions[:, 0].min():.3f}, {actions[:, 0].max():.3f}]")
-        print(f"    Y: [{actions[:, 1].min():.3f}, {actions[:, 1].max():.3f}]")
-        print(f"    Z: [{actions[:, 2].min():.3f}, {actions[:, 2].max():.3f}]")
+        print(f"    X: [{action_min[0]:.3f}, {action_max[0]:.3f}]")
+        print(f"    Y: [{action_min[1]:.3f}, {action_max[1]:.3f}]")
+        print(f"    Z: [{action_min[2]:.3f}, {action_max[2]:.3f}]")
 
         print(f"\n  Rotation Range:")
-        print(f"    Roll:  [{actions[:, 3].min():.3f}, {actions[:, 3].max():.3f}]")
-        print(f"    Pitch: [{actions[:, 4].min():.3f}, {actions[:, 4].max():.3f}]")
-        print(f"    Yaw:   [{actions[:, 5].min():.3f}, {actions[:, 5].max():.3f}]")
+        print(f"    Roll:  [{action_min[3]:.3f}, {action_max[3]:.3f}]")
+        print(f"    Pitch: [{action_min[4]:.3f}, {action_max[4]:.3f}]")
+        print(f"    Yaw:   [{action_min[5]:.3f}, {action_max[5]:.3f}]")
 
         print(f"\n  Gripper Statistics:")
-        print(f"    Min:  {actions[:, 6].min():.3f}")
-        print(f"    Max:  {actions[:, 6].max():.3f}")
-        print(f"    Mean: {actions[:, 6].mean():.3f}")
+        print(f"    Min:  {action_min[6]:.3f}")
+        print(f"    Max:  {action_max[6]:.3f}")
+        print(f"    Mean: {action_mean[6]:.3f}")
     
     else:
         print(f"  Type: Unknown ({action_dim} DOF)")
         print(f"\n  Overall Range:")
         for i in range(action_dim):
-            print(f"    Action {i}: [{actions[:, i].min():.3f}, {actions[:, i].max():.3f}]")
+            print(f"    Action {i}: [{action_min[i]:.3f}, {action_max[i]:.3f}]")
 
     print("\n" + "=" * 60 + "\n")
 
@@ -266,6 +356,8 @@ def main():
 
     print(f"Loading demonstration from: {demo_path}")
     demo = load_demonstration(str(demo_path))
+    # Pickle and JSON recordings may store the actions as a list, convert them once for all consumers
+    demo["actions"] = np.asarray(demo["actions"])
 
     if args.list_keys:
         print("\nDemonstration Keys:")
@@ -273,13 +365,18 @@ def main():
             if key == "metadata":
                 print(f"  - {key}: {demo[key]}")
             else:
-                print(f"  - {key}: shape={np.array(demo[key]).shape}")
+                _print_keys(key, demo[key], indent=2)
         print()
 
     print_demo_stats(demo)
 
-    if args.plot or args.save_plot:
-        plot_demonstration(demo, args.save_plot)
+    if (args.plot or args.save_plot) and len(demo["actions"]) == 0:
+        print("Nothing to plot: the demonstration has no steps.")
+    elif args.plot or args.save_plot:
+        if not args.plot:
+            # Only saving the plot, so render off-screen with the raster-only Agg backend
+            plt.switch_backend("Agg")
+        plot_demonstration(demo, args.save_plot, show=args.plot)
 
 
 if __name__ == "__main__":
@@ -4,56 +4,135 @@ from __future__ import annotations
 
 import json
 import pickle
+import threading
+import time
+from collections.abc import Collection
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+try:
+    # Optional, much faster JSON encoder with native support for numpy arrays
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 
 class DemonstrationRecorder:
-    """Records teleoperation demonstrations for later use in imitation learning."""
+    """Records teleoperation demonstrations for later use in imitation learning.
+
+    The 'pickle', 'json' and 'npz' formats buffer the whole demonstration in memory and write it when the recording
+    stops. Every field is buffered in structure-of-arrays layout: one preallocated array per field, or per key of
+    dictionary fields such as the robot state, indexed by step. The arrays double in size when full.
+    The 'hdf5' format streams the recording into chunked, resizable datasets instead and only keeps the steps of the
+    current chunk in memory, so memory use does not grow with the length of the recording.
+
+    In-memory demonstrations can be written on a background thread, so that stopping a recording does not block the
+    caller until the file is written. Call :meth:`wait_for_saves` before exiting.
+    """
+
+    RECORDABLE_FIELDS = ("observations", "actions", "robot_states", "hand_poses", "timestamps")
+    """Names of the per-step fields that can be recorded."""
+
+    FORMAT_VERSION = 2
+    """Version of the saved layout, stored as ``metadata['format_version']``. Version 1 (no version stored) saved
+    per-step lists, with one dictionary per step for the dictionary fields. Version 2 saves one array per field, or
+    per key of the dictionary fields, whose first dimension is the step."""
 
-    def __init__(self, save_dir: str = "demonstrations", format: str = "pickle"):
+    _HDF5_CHUNK_ROWS = 256
+    """Number of steps per HDF5 chunk. Steps are staged in memory and written one chunk at a time."""
+
+    def __init__(
+        self,
+        save_dir: str = "demonstrations",
+        format: str = "pickle",
+        capacity: int = 1024,
+        compression: str | None = None,
+        record: Collection[str] = RECORDABLE_FIELDS,
+        background_save: bool = False,
+    ):
         """Initialize the demonstration recorder.
 
         Args:
             save_dir: Directory to save demonstrations.
-            format: Save format - 'pickle', 'json', or 'npz'.
+            format: Save format - 'pickle', 'json', 'npz', or 'hdf5'.
+            capacity: Number of steps preallocated for in-memory recordings. The buffers grow as needed.
+            compression: Compression of 'npz' archives - None to store the arrays uncompressed, which is the fastest
+                to write, or 'zlib'. Streamed 'hdf5' recordings are always compressed with LZF.
+            record: Names of the per-step fields to record, see :attr:`RECORDABLE_FIELDS`. Fields that are not
+                recorded are neither kept in memory nor saved. Defaults to all fields.
+            background_save: Whether to write in-memory demonstrations on a background thread when the recording
+                stops. Streamed 'hdf5' recordings are always finished in the calling thread.
+
+        Raises:
+            ValueError: If ``capacity`` is not positive or ``record`` contains an unknown field name.
         """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        unknown_fields = set(record) - set(self.RECORDABLE_FIELDS)
+        if unknown_fields:
+            raise ValueError(f"Unknown fields to record: {sorted(unknown_fields)}")
+
         self.save_dir = Path(save_dir)
         self.save_dir.mkdir(parents=True, exist_ok=True)
         self.format = format
+        self.compression = compression
+        self.record = frozenset(record)
+        self.background_save = background_save
 
         # Current recording state
         self.is_recording = False
-        self.current_demo = {
-            "observations": [],
-            "actions": [],
-            "robot_states": [],
-            "hand_poses": [],
-            "timestamps": [],
-        }
+        self.current_demo: dict[str, Any] = {}
         self.start_time = None
+        # Monotonic clock reading at the start of the recording, used for step timestamps and durations
+        self._start_perf_time = 0.0
+        self.num_steps = 0
+        self.capacity = capacity
+
+        # Preallocated arrays of in-memory recordings, keyed by field path (e.g. 'robot_states/joint_positions')
+        # and created on first use. All arrays have the same number of rows.
+        self._buffers: dict[str, np.ndarray] = {}
+        self._num_rows = capacity
+
+        # Open HDF5 file while streaming a recording, with the staged rows of the current chunk per dataset
+        self._h5_file = None
+        self._h5_buffers: dict[str, tuple[Any, np.ndarray]] = {}
+        self._h5_num_flushed = 0
+
+        # Threads writing demonstrations in the background
+        self._save_threads: list[threading.Thread] = []
 
     def start_recording(self) -> None:
-        """Start a new demonstration recording."""
+        """Start a new demonstration recording.
+
+        Raises:
+            RuntimeError: If a recording is already active. Stop it first.
+        """
+        if self.is_recording:
+            raise RuntimeError("A recording is already active, stop it before starting a new one.")
         self.is_recording = True
         self.start_time = datetime.now()
-        self.current_demo = {
-            "observations": [],
-            "actions": [],
-            "robot_states": [],
-            "hand_poses": [],
-            "timestamps": [],
-        }
+        self.current_demo = {}
+        self.num_steps = 0
+        self._buffers = {}
+        self._num_rows = self.capacity
+        if self.format == "hdf5":
+            import h5py
+
+            self._h5_file = h5py.File(self.save_dir / f"{self._demo_filename()}.h5", "w")
+            self._h5_buffers = {}
+            self._h5_num_flushed = 0
+        self._start_perf_time = time.perf_counter()
         print(f"[Recording] Started at {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
     def stop_recording(self) -> str | None:
         """Stop the current recording and save to disk.
 
         Returns:
-            str: Path to saved demonstration file, or None if not recording.
+            str: Path to saved demonstration file, or None if not recording. With :attr:`background_save`, the file
+            may still be being written when this returns.
         """
         if not self.is_recording:
             print("[Recording] No active recording to stop.")
@@ -61,50 +140,100 @@ class DemonstrationRecorder:
 
         self.is_recording = False
         end_time = datetime.now()
-        duration = (end_time - self.start_time).total_seconds()
-
-        # Add metadata
+        duration = time.perf_counter() - self._start_perf_time
+
+        # Collect the recorded arrays and add metadata. The arrays are handed over to the writer, the next recording
+        # allocates new buffers.
+        arrays = {path: buffer[: self.num_steps] for path, buffer in self._buffers.items()}
+        # Buffers are created on the first step. Fields without any step are saved as empty arrays, so the saved
+        # fields do not depend on the number of steps.
+        for name in self._missing_fields(arrays):
+            arrays[name] = np.empty(0, dtype=np.float32)
+        self.current_demo = _nest(arrays)
         self.current_demo["metadata"] = {
             "start_time": self.start_time.isoformat(),
             "end_time": end_time.isoformat(),
             "duration_seconds": duration,
-            "num_steps": len(self.current_demo["actions"]),
+            "num_steps": self.num_steps,
+            "format_version": self.FORMAT_VERSION,
         }
 
-        # Generate filename
-        timestamp_str = self.start_time.strftime("%Y%m%d_%H%M%S")
-        filename = f"demo_{timestamp_str}"
+        # The HDF5 stream only has the last partial chunk left to write
+        if self.format == "hdf5":
+            filepath = Path(self._h5_file.filename)
+            for name in self._missing_fields(self._h5_file.keys()):
+                self._h5_file.create_dataset(name, shape=(0,), maxshape=(None,), dtype=np.float32)
+            self._close_stream(self.current_demo["metadata"])
+            print(f"[Recording] Saved demonstration to {filepath}")
+        else:
+            suffix = {"pickle": ".pkl", "npz": ".npz", "json": ".json"}.get(self.format)
+            if suffix is None:
+                raise ValueError(f"Unsupported format: {self.format}")
+            filepath = self.save_dir / f"{self._demo_filename()}{suffix}"
+            if self.background_save:
+                thread = threading.Thread(
+                    target=self._write, args=(filepath, arrays, self.current_demo), name=f"save-{filepath.name}"
+                )
+                thread.start()
+                self._save_threads.append(thread)
+            else:
+                self._write(filepath, arrays, self.current_demo)
+
+        print(f"[Recording] Duration: {duration:.2f}s, Steps: {self.current_demo['metadata']['num_steps']}")
+
+        return str(filepath)
 
-        # Save based on format
+    def _missing_fields(self, paths: Collection[str]) -> list[str]:
+        """Get the recorded fields that have no data under the given paths.
+
+        Args:
+            paths: Paths of the recorded arrays, e.g. 'actions' or 'robot_states/joint_positions'.
+
+        Returns:
+            Names of the recorded fields without any array.
+        """
+        top_level = {path.split("/", 1)[0] for path in paths}
+        return [name for name in self.RECORDABLE_FIELDS if name in self.record and name not in top_level]
+
+    def wait_for_saves(self) -> None:
+        """Block until all demonstrations saved in the background are written."""
+        for thread in self._save_threads:
+            thread.join()
+        self._save_threads = []
+
+    def _write(self, filepath: Path, arrays: dict[str, np.ndarray], demo: dict[str, Any]) -> None:
+        """Write an in-memory demonstration to disk.
+
+        Args:
+            filepath: Path of the demonstration file. Its suffix matches the save format.
+            arrays: Recorded arrays keyed by field path.
+            demo: The same arrays as nested dictionaries, with the metadata.
+        """
         if self.format == "pickle":
-            filepath = self.save_dir / f"{filename}.pkl"
             with open(filepath, "wb") as f:
-                pickle.dump(self.current_demo, f)
+                pickle.dump(demo, f, protocol=pickle.HIGHEST_PROTOCOL)
         elif self.format == "npz":
-            filepath = self.save_dir / f"{filename}.npz"
-            # Convert lists to numpy arrays
-            np.savez_compressed(
-                filepath,
-                observations=np.array(self.current_demo["observations"]),
-                actions=np.array(self.current_demo["actions"]),
-                robot_states=np.array(self.current_demo["robot_states"]),
-                hand_poses=np.array(self.current_demo["hand_poses"]),
-                timestamps=np.array(self.current_demo["timestamps"]),
-                metadata=json.dumps(self.current_demo["metadata"]),
-            )
+            if self.compression is None:
+                savez = np.savez
+            elif self.compression == "zlib":
+                savez = np.savez_compressed
+            else:
+                raise ValueError(f"Unsupported compression: {self.compression}")
+            # Dictionary fields are stored with one array per key path
+            savez(filepath, **arrays, metadata=json.dumps(demo["metadata"]))
         elif self.format == "json":
-            filepath = self.save_dir / f"{filename}.json"
-            # Convert numpy arrays to lists for JSON serialization
-            demo_serializable = self._make_serializable(self.current_demo)
-            with open(filepath, "w") as f:
-                json.dump(demo_serializable, f, indent=2)
-        else:
-            raise ValueError(f"Unsupported format: {self.format}")
+            if orjson is not None:
+                # Serialize numpy arrays natively, other non-serializable objects through the fallback conversion
+                options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+                with open(filepath, "wb") as f:
+                    f.write(orjson.dumps(demo, default=self._make_serializable, option=options))
+            else:
+                # Convert numpy arrays to lists for JSON serialization
+                demo_serializable = self._make_serializable(demo)
+                with open(filepath, "w") as f:
+                    json.dump(demo_serializable, f, indent=2)
 
         print(f"[Recording] Saved demonstration to {filepath}")
-        print(f"[Recording] Duration: {duration:.2f}s, Steps: {self.current_demo['metadata']['num_steps']}")
-
-        return str(filepath)
 
     def add_step(
         self,
@@ -112,27 +241,138 @@ class DemonstrationRecorder:
         action: np.ndarray,
         robot_state: dict[str, Any],
         hand_pose: dict[str, np.ndarray],
+        step_time: float | None = None,
     ) -> None:
         """Add a single step to the current demonstration.
 
+        The given arrays are copied, so the caller may reuse them for the next step. Dictionaries are recorded with
+        one array per key; steps in which a key is missing keep the fill value (NaN for floating point data).
+
         Args:
             observation: Observation array from the environment.
             action: Action array sent to the robot.
             robot_state: Dictionary containing robot joint positions, velocities, etc.
             hand_pose: Dictionary containing hand tracking data.
+            step_time: Value of :func:`time.perf_counter` when the step was taken. Defaults to None, which uses the
+                current time.
         """
         # TODO: pass actual simulation time step instead of querying the current time
         if not self.is_recording:
             return
 
         # Calculate relative timestamp
-        timestamp = (datetime.now() - self.start_time).total_seconds()
+        if step_time is None:
+            step_time = time.perf_counter()
+        timestamp = step_time - self._start_perf_time
+
+        step = (
+            ("observations", observation),
+            ("actions", action),
+            ("robot_states", robot_state),
+            ("hand_poses", hand_pose),
+            ("timestamps", timestamp),
+        )
+
+        if self._h5_file is not None:
+            for name, value in step:
+                if name in self.record:
+                    self._stage_row(name, value)
+            self.num_steps += 1
+            if self.num_steps - self._h5_num_flushed == self._HDF5_CHUNK_ROWS:
+                self._flush_stream()
+            return
+
+        if self.num_steps == self._num_rows:
+            self._grow_buffers()
+        for name, value in step:
+            if name in self.record:
+                self._append_row(name, value)
+        self.num_steps += 1
+
+    def _append_row(self, name: str, value: Any) -> None:
+        """Copy the value of the current step into the preallocated array of ``name``.
 
-        self.current_demo["observations"].append(observation.copy())
-        self.current_demo["actions"].append(action.copy())
-        self.current_demo["robot_states"].append(robot_state.copy())
-        self.current_demo["hand_poses"].append(hand_pose.copy())
-        self.current_demo["timestamps"].append(timestamp)
+        Dictionaries are recorded with one array per key, created on first use.
+
+        Args:
+            name: Path of the recorded field.
+            value: Array, scalar, or (nested) dictionary of arrays of the current step.
+        """
+        if isinstance(value, dict):
+            for key, item in value.items():
+                self._append_row(f"{name}/{key}", item)
+            return
+
+        buffer = self._buffers.get(name)
+        if buffer is None:
+            value = np.asarray(value)
+            fill_value = np.nan if np.issubdtype(value.dtype, np.floating) else 0
+            buffer = self._buffers[name] = np.full((self._num_rows,) + value.shape, fill_value, dtype=value.dtype)
+        buffer[self.num_steps] = value
+
+    def _grow_buffers(self) -> None:
+        """Double the number of rows of all in-memory buffers."""
+        for name, buffer in self._buffers.items():
+            fill_value = np.nan if np.issubdtype(buffer.dtype, np.floating) else 0
+            self._buffers[name] = np.concatenate((buffer, np.full_like(buffer, fill_value)))
+        self._num_rows *= 2
+
+    def _demo_filename(self) -> str:
+        """Get the file name (without suffix) of the current demonstration."""
+        return f"demo_{self.start_time.strftime('%Y%m%d_%H%M%S')}"
+
+    def _stage_row(self, name: str, value: Any) -> None:
+        """Stage the value of the current step for the HDF5 dataset ``name``.
+
+        Dictionaries are written as groups with one dataset per key. Datasets are created on first use. Steps in which
+        a key is missing keep the dataset fill value (NaN for floating point data).
+
+        Args:
+            name: Path of the dataset or group in the HDF5 file.
+            value: Array, scalar, or (nested) dictionary of arrays.
+        """
+        if isinstance(value, dict):
+            for key, item in value.items():
+                self._stage_row(f"{name}/{key}", item)
+            return
+
+        entry = self._h5_buffers.get(name)
+        if entry is None:
+            value = np.asarray(value)
+            fill_value = np.nan if np.issubdtype(value.dtype, np.floating) else 0
+            dataset = self._h5_file.create_dataset(
+                name,
+                shape=(self._h5_num_flushed,) + value.shape,
+                maxshape=(None,) + value.shape,
+                chunks=(self._HDF5_CHUNK_ROWS,) + value.shape,
+                dtype=value.dtype,
+                compression="lzf",
+                fillvalue=fill_value,
+            )
+            buffer = np.full((self._HDF5_CHUNK_ROWS,) + value.shape, fill_value, dtype=value.dtype)
+            entry = self._h5_buffers[name] = (dataset, buffer)
+        entry[1][self.num_steps - self._h5_num_flushed] = value
+
+    def _flush_stream(self) -> None:
+        """Append the staged steps to the HDF5 datasets."""
+        start, stop = self._h5_num_flushed, self.num_steps
+        for dataset, buffer in self._h5_buffers.values():
+            dataset.resize(stop, axis=0)
+            dataset[start:stop] = buffer[: stop - start]
+            buffer.fill(dataset.fillvalue)
+        self._h5_num_flushed = stop
+
+    def _close_stream(self, metadata: dict[str, Any]) -> None:
+        """Write the remaining staged steps and the metadata, then close the HDF5 file.
+
+        Args:
+            metadata: Demonstration metadata, stored as attributes of the file.
+        """
+        self._flush_stream()
+        self._h5_file.attrs.update(metadata)
+        self._h5_file.close()
+        self._h5_file = None
+        self._h5_buffers = {}
 
     def _make_serializable(self, obj: Any) -> Any:
         """Convert numpy arrays and other non-serializable objects to JSON-compatible types.
@@ -163,18 +403,71 @@ class DemonstrationRecorder:
         if not self.is_recording:
             return {"recording": False}
 
-        duration = (datetime.now() - self.start_time).total_seconds()
+        duration = time.perf_counter() - self._start_perf_time
         return {
             "recording": True,
             "duration_seconds": duration,
-            "num_steps": len(self.current_demo["actions"]),
+            "num_steps": self.num_steps,
             "start_time": self.start_time.isoformat(),
         }
 
 
+def _nest(arrays: dict[str, np.ndarray]) -> dict[str, Any]:
+    """Turn arrays keyed by slash-separated paths into nested dictionaries.
+
+    Args:
+        arrays: Arrays keyed by paths such as 'robot_states/joint_positions'.
+
+    Returns:
+        Nested dictionary with one level per path component.
+    """
+    nested = {}
+    for path, array in arrays.items():
+        *parents, key = path.split("/")
+        node = nested
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[key] = array
+    return nested
+
+
+def _stack_steps(steps: Any) -> Any:
+    """Stack the per-step values of a field into arrays whose first dimension is the step.
+
+    Args:
+        steps: Sequence of per-step values. Dictionaries are stacked per key.
+
+    Returns:
+        Array, or (nested) dictionary of arrays for dictionary values.
+    """
+    steps = list(steps)
+    if not steps:
+        return np.empty(0, dtype=np.float32)
+    if isinstance(steps[0], dict):
+        return {key: _stack_steps(step[key] for step in steps) for key in steps[0]}
+    return np.asarray(steps)
+
+
+def _as_arrays(value: Any) -> Any:
+    """Convert the (nested) lists of a loaded JSON field into arrays.
+
+    Args:
+        value: List, or (nested) dictionary of lists.
+
+    Returns:
+        The value with each list replaced by an array.
+    """
+    if isinstance(value, dict):
+        return {key: _as_arrays(item) for key, item in value.items()}
+    return np.asarray(value) if len(value) else np.empty(0, dtype=np.float32)
+
+
 def load_demonstration(filepath: str) -> dict[str, Any]:
     """Load a saved demonstration from disk.
 
+    Demonstrations saved in the version 1 layout (per-step lists) are converted to the current layout, see
+    :attr:`DemonstrationRecorder.FORMAT_VERSION`, so consumers only need to handle one layout.
+
     Args:
         filepath: Path to the demonstration file.
 
@@ -185,21 +478,40 @@ def load_demonstration(filepath: str) -> dict[str, Any]:
 
     if filepath.suffix == ".pkl":
         with open(filepath, "rb") as f:
-            return pickle.load(f)
+            demo = pickle.load(f)
     elif filepath.suffix == ".npz":
         data = np.load(filepath, allow_pickle=True)
-        return {
-            "observations": data["observations"],
-            "actions": data["actions"],
-            "robot_states": data["robot_states"],
-            "hand_poses": data["hand_poses"],
-            "timestamps": data["timestamps"],
-            "metadata": json.loads(str(data["metadata"])),
-        }
+        demo = _nest({name: data[name] for name in data.files if name != "metadata"})
+        demo["metadata"] = json.loads(str(data["metadata"]))
     elif filepath.suffix == ".json":
-        with open(filepath, "r") as f:
-            return json.load(f)
+        if orjson is not None:
+            with open(filepath, "rb") as f:
+                demo = orjson.loads(f.read())
+        else:
+            with open(filepath, "r") as f:
+                demo = json.load(f)
+        if demo["metadata"].get("format_version", 1) >= 2:
+            for name in DemonstrationRecorder.RECORDABLE_FIELDS:
+                if name in demo:
+                    demo[name] = _as_arrays(demo[name])
+    elif filepath.suffix == ".h5":
+        import h5py
+
+        def _read(group):
+            return {
+                key: _read(item) if isinstance(item, h5py.Group) else item[()] for key, item in group.items()
+            }
+
+        with h5py.File(filepath, "r") as f:
+            demo = _read(f)
+            demo["metadata"] = {key: np.asarray(value).item() for key, value in f.attrs.items()}
     else:
         raise ValueError(f"Unsupported file format: {filepath.suffix}")
 
+    if demo["metadata"].get("format_version", 1) < 2:
+        for name in DemonstrationRecorder.RECORDABLE_FIELDS:
+            if name in demo:
+                demo[name] = _stack_steps(demo[name])
+    return demo
+
 
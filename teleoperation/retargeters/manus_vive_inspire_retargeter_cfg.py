@@ -4,13 +4,37 @@ from __future__ import annotations
 
 import numpy as np
 import torch
+# Assumes numba >= 0.57 (listed in teleoperation/requirements.txt), the first release supporting Python 3.11
+from numba import njit
 
+from isaaclab.devices.openxr.openxr_device import OpenXRDevice
 from isaaclab.devices.retargeter_base import RetargeterBase, RetargeterCfg
 from isaaclab.controllers import DifferentialIKControllerCfg, DifferentialIKController
 from isaaclab.managers import SceneEntityCfg
 from isaaclab.utils import configclass
 from isaaclab.scene import InteractiveScene
 
+# fastmath is not enabled: it lets LLVM assume that no value is NaN, which would drop the NaN guard below
+@njit(cache=True, boundscheck=False)
+def _map_fingers(
+    raw: np.ndarray, scale: float, lower: float, upper: float, smoothing: float, state: np.ndarray
+) -> None:
+    """Scale the raw finger angles, clip them to the joint limits and smooth them into ``state`` in a single pass.
+
+    NaN angles (e.g. from a dropped glove frame) are skipped, so the corresponding states keep their previous value
+    instead of being poisoned for all following calls.
+    """
+    for i in range(raw.shape[0]):
+        if np.isnan(raw[i]):
+            continue
+        value = raw[i] * scale
+        if value < lower:
+            value = lower
+        elif value > upper:
+            value = upper
+        state[i] += (1.0 - smoothing) * (value - state[i])
+
+
 class TaskSpaceController:
 
     def __init__(self, scene: InteractiveScene):
@@ -56,6 +80,45 @@ class ManusViveInspireRetargeter(RetargeterBase):
 
     cfg: ManusViveInspireRetargeterCfg
 
+    # Manus provides joint angles for each finger segment
+    # The exact key names depend on the Manus SDK version
+    # Common names: thumb_cmc, thumb_mcp, thumb_ip, thumb_tip
+    # finger_mcp, finger_pip, finger_dip, finger_tip
+    _FLEX_ANGLE_MAP: tuple[tuple[str, str, int], ...] = (
+        # === Thumb (4 DOF) ===
+        # Inspire: thumb_proximal_yaw_joint, thumb_proximal_pitch_joint,
+        #          thumb_intermediate_joint, thumb_distal_joint
+        # CMC joint -> yaw and pitch
+        ("thumb", "cmc_spread", 0),
+        ("thumb", "cmc_flex", 1),
+        # MCP joint -> intermediate
+        ("thumb", "mcp", 2),
+        # IP joint -> distal
+        ("thumb", "ip", 3),
+        # === Index Finger (2 DOF) ===
+        ("index", "mcp", 4),
+        ("index", "pip", 5),
+        # === Middle Finger (2 DOF) ===
+        ("middle", "mcp", 6),
+        ("middle", "pip", 7),
+        # === Ring Finger (2 DOF) ===
+        ("ring", "mcp", 8),
+        ("ring", "pip", 9),
+        # === Pinky Finger (2 DOF) ===
+        ("pinky", "mcp", 10),
+        ("pinky", "pip", 11),
+    )
+    """Manus (finger, joint) flex angle keys and their index in the 12-element finger joint array."""
+
+    # Inspire hand joints are typically 0 to ~90 degrees (0 to 1.57 radians)
+    _FINGER_JOINT_LOWER: float = 0.0
+    """Lower limit of the finger joint positions in radians (fully extended)."""
+    _FINGER_JOINT_UPPER: float = 1.47
+    """Upper limit of the finger joint positions in radians (~84 degrees, fully flexed)."""
+
+    _NEUTRAL_ARM_POSE: tuple[float, ...] = (0.0, 0.0, 0.0, 1.57, 0.0, 0.0, 0.0)
+    """Neutral arm joint positions (joint_4 at 90 degrees) commanded while the palm is tracked."""
+
     def __init__(self, cfg: ManusViveInspireRetargeterCfg):
         """Initialize the retargeter.
 
@@ -65,11 +128,22 @@ class ManusViveInspireRetargeter(RetargeterBase):
         super().__init__(cfg)
         self.cfg = cfg
         self._wrist_offset = np.array(self.cfg.wrist_offset, dtype=np.float32)
+        self._finger_scale = np.float32(self.cfg.finger_scale)
+        self._hand_right_key = OpenXRDevice.TrackingTarget.HAND_RIGHT
+
+        # Raw finger flex angles, reused on every call
+        self._finger_raw = np.zeros(12, dtype=np.float32)
 
-        # Previous finger states for smoothing
-        self._prev_finger_state = np.zeros(12, dtype=np.float32)
+        # Command assembled on the host and copied to the simulation device in one transfer. Its finger part holds
+        # the smoothed finger states, the canonical smoothing buffer updated in place.
+        self._command_host = torch.zeros(19, dtype=torch.float32)
+        self._command_host_np = self._command_host.numpy()
+        self._finger_state = self._command_host_np[7:19]
+        self._neutral_arm_pose = np.array(self._NEUTRAL_ARM_POSE, dtype=np.float32)
 
-        self
+        # Command kept on the simulation device and updated in place
+        self._command = torch.zeros(19, dtype=torch.float32, device=self._sim_device)
+        self._zero_command = torch.zeros(19, dtype=torch.float32, device=self._sim_device)
 
     def retarget(self, raw_data: dict) -> "torch.Tensor":
         """Convert ManusVive tracking data to robot commands.
@@ -80,7 +154,7 @@ class ManusViveInspireRetargeter(RetargeterBase):
                 - Finger joints: flex angles for each finger segment
 
         Returns:
-            numpy.ndarray: Control command with 19 elements:
+            torch.Tensor: Control command with 19 elements, reused by the next call:
                 - [0:7]: Arm joint positions (computed from hand pose)
                 - [7:19]: Hand joint positions (12 DOF):
                     - [7:11]: Thumb (yaw, pitch, intermediate, distal)
@@ -89,17 +163,15 @@ class ManusViveInspireRetargeter(RetargeterBase):
                     - [15:17]: Ring (proximal, intermediate)
                     - [17:19]: Pinky (proximal, intermediate)
         """
-        from isaaclab.devices.openxr.openxr_device import OpenXRDevice
-
         # Get right hand data (for controlling the robot)
-        hand_data = raw_data.get(OpenXRDevice.TrackingTarget.HAND_RIGHT, {})
+        hand_data = raw_data.get(self._hand_right_key, {})
 
         if not hand_data:
             # Return zero command if no valid data
-            return torch.zeros(19, dtype=torch.float32, device=self._sim_device)
+            return self._zero_command
 
-        # Initialize command array: 7 arm + 12 hand joints
-        command = np.zeros(19, dtype=np.float32)
+        # Command array: 7 arm + 12 hand joints, assembled on the host
+        command = self._command_host_np
 
         # === Arm Control (SE3 from hand pose) ===
         # For now, we'll compute arm IK from hand position/orientation
@@ -111,80 +183,59 @@ class ManusViveInspireRetargeter(RetargeterBase):
 
             # For teleoperation, we'll output delta pose for IK controller
             # For direct control, you'd need IK here
-            # For now, keep arm in neutral pose and only control hand
-            command[0:7] = [0.0, 0.0, 0.0, 1.57, 0.0, 0.0, 0.0]
+            # For now, keep arm in neutral pose (joint_4 at 90 degrees) and only control hand
+            command[:7] = self._neutral_arm_pose
+        else:
+            command[:7] = 0.0
 
         # === Hand Control (Direct Joint Mapping) ===
-        finger_joints = self._extract_finger_joints(hand_data)
+        # Map to Inspire hand joints, smoothed in place in command[7:19]
+        self._extract_finger_joints(hand_data)
 
-        # Apply smoothing
-        if self.cfg.smoothing > 0.0:
-            alpha = self.cfg.smoothing
-            finger_joints = alpha * self._prev_finger_state + (1.0 - alpha) * finger_joints
-            self._prev_finger_state = finger_joints
+        # The command is copied to the device, so callers modifying it cannot corrupt the smoothing state
+        self._command.copy_(self._command_host)
 
-        # Map to Inspire hand joints
-        command[7:19] = finger_joints
-
-        # Convert to torch tensor for compatibility with DeviceBase
-        return torch.tensor(command, dtype=torch.float32, device=self._sim_device)
+        return self._command
 
     def _extract_finger_joints(self, hand_data: dict) -> np.ndarray:
-        """Extract and map finger joint angles from Manus hand data.
+        """Extract, map and smooth finger joint angles from Manus hand data.
 
         Args:
             hand_data: Dictionary of hand tracking data from Manus gloves
 
         Returns:
-            numpy.ndarray: 12-element array of finger joint positions
+            numpy.ndarray: 12-element array of smoothed finger joint positions. The array is updated by the next call.
         """
-        finger_joints = np.zeros(12, dtype=np.float32)
+        raw = self._pack_raw(hand_data)
 
-        # Manus provides joint angles for each finger segment
-        # The exact key names depend on the Manus SDK version
-        # Common names: thumb_cmc, thumb_mcp, thumb_ip, thumb_tip
-        # finger_mcp, finger_pip, finger_dip, finger_tip
+        # Scale, clip to the valid ranges and apply smoothing: state = alpha * state + (1 - alpha) * new
+        _map_fingers(
+            raw,
+            self._finger_scale,
+            self._FINGER_JOINT_LOWER,
+            self._FINGER_JOINT_UPPER,
+            self.cfg.smoothing,
+            self._finger_state,
+        )
 
-        # === Thumb (4 DOF) ===
-        # Inspire: thumb_proximal_yaw_joint, thumb_proximal_pitch_joint,
-        #          thumb_intermediate_joint, thumb_distal_joint
-        if "thumb" in hand_data:
-            thumb_data = hand_data["thumb"]
-            # CMC joint -> yaw and pitch
-            finger_joints[0] = self._get_flex_angle(thumb_data, "cmc_spread", 0.0) * self.cfg.finger_scale
-            finger_joints[1] = self._get_flex_angle(thumb_data, "cmc_flex", 0.0) * self.cfg.finger_scale
-            # MCP joint -> intermediate
-            finger_joints[2] = self._get_flex_angle(thumb_data, "mcp", 0.0) * self.cfg.finger_scale
-            # IP joint -> distal
-            finger_joints[3] = self._get_flex_angle(thumb_data, "ip", 0.0) * self.cfg.finger_scale
+        return self._finger_state
 
-        # === Index Finger (2 DOF) ===
-        if "index" in hand_data:
-            index_data = hand_data["index"]
-            finger_joints[4] = self._get_flex_angle(index_data, "mcp", 0.0) * self.cfg.finger_scale
-            finger_joints[5] = self._get_flex_angle(index_data, "pip", 0.0) * self.cfg.finger_scale
+    def _pack_raw(self, hand_data: dict) -> np.ndarray:
+        """Pack the raw finger flex angles from Manus hand data into a 12-element array.
 
-        # === Middle Finger (2 DOF) ===
-        if "middle" in hand_data:
-            middle_data = hand_data["middle"]
-            finger_joints[6] = self._get_flex_angle(middle_data, "mcp", 0.0) * self.cfg.finger_scale
-            finger_joints[7] = self._get_flex_angle(middle_data, "pip", 0.0) * self.cfg.finger_scale
+        Args:
+            hand_data: Dictionary of hand tracking data from Manus gloves
 
-        # === Ring Finger (2 DOF) ===
-        if "ring" in hand_data:
-            ring_data = hand_data["ring"]
-            finger_joints[8] = self._get_flex_angle(ring_data, "mcp", 0.0) * self.cfg.finger_scale
-            finger_joints[9] = self._get_flex_angle(ring_data, "pip", 0.0) * self.cfg.finger_scale
+        Returns:
+            numpy.ndarray: 12-element array of unscaled flex angles. The array is reused by the next call.
+        """
+        finger_joints = self._finger_raw
+        finger_joints.fill(0.0)
 
-        # === Pinky Finger (2 DOF) ===
-        if "pinky" in hand_data:
-            pinky_data = hand_data["pinky"]
-            finger_joints[10] = self._get_flex_angle(pinky_data, "mcp", 0.0) * self.cfg.finger_scale
-            finger_joints[11] = self._get_flex_angle(pinky_data, "pip", 0.0) * self.cfg.finger_scale
-
-        # Ensure all angles are within valid ranges
-        # Inspire hand joints are typically 0 to ~90 degrees (0 to 1.57 radians)
-        finger_joints = np.clip(finger_joints, 0.0, 1.47)  # ~84 degrees max
+        for finger_name, joint_name, index in self._FLEX_ANGLE_MAP:
+            finger_data = hand_data.get(finger_name)
+            if finger_data is not None:
+                finger_joints[index] = self._get_flex_angle(finger_data, joint_name, 0.0)
 
         return finger_joints
 
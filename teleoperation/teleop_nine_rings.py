@@ -2,7 +2,10 @@
 with full dexterous hand control and absolute positioning via attached trackers."""
 
 import argparse
+import time
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 import gymnasium as gym
 import numpy as np
 import torch
@@ -15,7 +18,22 @@ parser.add_argument(
     "--num_envs",
     type=int,
     default=1,
-    help="Number of environments (typically 1 for teleoperation).",
+    help="Number of environments (typically 1 for teleoperation). The command is applied to all of them.",
+)
+parser.add_argument(
+    "--action_noise",
+    type=float,
+    default=0.0,
+    help="Standard deviation of Gaussian noise added to the command of every environment except the first.",
+)
+parser.add_argument(
+    "--command_deadband",
+    type=float,
+    default=0.0,
+    help=(
+        "Skip environment steps while no joint command changed by more than this amount since the last step"
+        " (0 disables). The physics is paused while steps are skipped."
+    ),
 )
 parser.add_argument(
     "--record",
@@ -33,9 +51,17 @@ parser.add_argument(
     "--record_format",
     type=str,
     default="pickle",
-    choices=["pickle", "json", "npz"],
+    choices=["pickle", "json", "npz", "hdf5"],
     help="Format for saving demonstrations.",
 )
+parser.add_argument(
+    "--record_fields",
+    type=str,
+    nargs="+",
+    default=["observations", "actions", "robot_states", "hand_poses", "timestamps"],
+    choices=["observations", "actions", "robot_states", "hand_poses", "timestamps"],
+    help="Per-step fields to record. Leaving out large fields reduces memory and disk usage.",
+)
 parser.add_argument(
     "--sensitivity",
     type=float,
@@ -63,7 +89,7 @@ from isaaclab.envs import ManagerBasedRLEnv
 import omni.log
 import omni.usd
 
-from isaaclab.devices.openxr.manus_vive import ManusVive, ManusViveCfg
+from isaaclab.devices.openxr.manus_vive import ManusVive, ManusViveCfg, RawHandFrame
 from isaaclab.devices.openxr.xr_cfg import XrCfg
 
 # Import local modules
@@ -74,6 +100,125 @@ from teleoperation.retargeters.manus_vive_inspire_retargeter_cfg import (
 from teleoperation.recording_utils import DemonstrationRecorder
 from environments.nine_rings_inspire_env_cfg import NineRingsInspireEnvCfg
 
+# Usage banner printed once the device and environment are set up
+BANNER = f"""
+{"=" * 60}
+NINE LINKED RINGS - DEXTEROUS HAND TELEOPERATION
+{"=" * 60}
+
+Gesture Controls:
+  - Gesture 'START': Begin teleoperation and recording
+  - Gesture 'STOP':  End teleoperation and save recording
+  - Gesture 'RESET': Reset the environment
+
+Teleoperation:
+  - Right hand controls the RM75 Inspire dexterous hand
+  - All 5 fingers are independently controlled (12 DOF)
+  - Arm follows hand position and orientation (7 DOF)
+  - Total: 19 DOF precise control
+
+Hand Mapping:
+  - Thumb: 4 joints (yaw, pitch, intermediate, distal)
+  - Each finger (index, middle, ring, pinky): 2 joints
+
+Sensitivity: {{sensitivity:.2f}}x
+{"=" * 60}
+"""
+
+# Policy observation terms recorded as robot state, with their names in the recording
+ROBOT_STATE_TERMS = (
+    ("joint_pos", "joint_positions"),
+    ("joint_vel", "joint_velocities"),
+    ("hand_pose", "hand_pose"),
+)
+
+# Placeholders recorded when running without an environment (read-only, shared by all steps)
+NO_ENV_JOINT_VELOCITIES = np.zeros(19, dtype=np.float32)
+NO_ENV_HAND_POSE = np.zeros(7, dtype=np.float32)
+NO_ENV_OBSERVATION = np.zeros(50, dtype=np.float32)
+for _placeholder in (NO_ENV_JOINT_VELOCITIES, NO_ENV_HAND_POSE, NO_ENV_OBSERVATION):
+    _placeholder.flags.writeable = False
+
+
+class StepDataCollector:
+    """Copies the data recorded for the first environment to the host in a single transfer.
+
+    The policy observation terms and the command are concatenated into a buffer on the simulation device and copied
+    into a host buffer. Both are allocated on the first step and reused afterwards (the host buffer is pinned when
+    the simulation runs on a GPU).
+    The copy is submitted right after the environment step and collected in the next loop iteration, so it overlaps
+    with the app update and the device poll instead of stalling the loop. The step time is taken on submission, so
+    the recorded timestamps are not delayed by the deferred collection.
+    """
+
+    def __init__(self):
+        self._device_buffer: torch.Tensor | None = None
+        self._host_buffer: torch.Tensor | None = None
+        self._host_data: np.ndarray | None = None
+        self._copy_done: torch.cuda.Event | None = None
+        self._robot_state_slices: dict[str, slice] = {}
+        self._num_obs = 0
+        self._pending_hand_pose: dict[str, Any] | None = None
+        self._pending_step_time = 0.0
+
+    def submit(self, obs: dict, command: torch.Tensor, hand_pose: dict[str, Any]) -> None:
+        """Start copying the observation and command of the first environment to the host.
+
+        Args:
+            obs: Observations returned by the environment step.
+            command: Command sent to the first environment.
+            hand_pose: Raw hand tracking data of the step. It is not copied and must stay unchanged until the step
+                is collected.
+        """
+        policy_obs = obs["policy"]
+        tensors = [term[0].reshape(-1) for term in policy_obs.values()]
+        tensors.append(command.reshape(-1).to(tensors[0].device, torch.float32))
+
+        if self._host_buffer is None:
+            self._allocate(policy_obs, tensors)
+        torch.cat(tensors, out=self._device_buffer)
+        self._host_buffer.copy_(self._device_buffer, non_blocking=True)
+        if self._copy_done is not None:
+            self._copy_done.record()
+        self._pending_hand_pose = hand_pose
+        self._pending_step_time = time.perf_counter()
+
+    def collect(self) -> tuple[np.ndarray, dict[str, np.ndarray], np.ndarray, dict[str, Any], float] | None:
+        """Wait for the submitted copy and return the step data.
+
+        The returned arrays are views into the host buffer and are overwritten by the next submitted step.
+
+        Returns:
+            Tuple of the flattened policy observation, the robot state, the command, the raw hand tracking data and
+            the :func:`time.perf_counter` value at submission, or None if no step is pending.
+        """
+        if self._pending_hand_pose is None:
+            return None
+        if self._copy_done is not None:
+            self._copy_done.synchronize()
+        hand_pose, self._pending_hand_pose = self._pending_hand_pose, None
+
+        host_data = self._host_data
+        robot_state = {name: host_data[index] for name, index in self._robot_state_slices.items()}
+        return host_data[: self._num_obs], robot_state, host_data[self._num_obs :], hand_pose, self._pending_step_time
+
+    def _allocate(self, policy_obs: dict[str, torch.Tensor], tensors: list[torch.Tensor]) -> None:
+        """Allocate the buffers and locate the robot state terms in the flattened observation."""
+        device = tensors[0].device
+        size = sum(tensor.numel() for tensor in tensors)
+        self._device_buffer = torch.empty(size, dtype=torch.float32, device=device)
+        self._host_buffer = torch.empty(size, dtype=torch.float32, pin_memory=device.type == "cuda")
+        self._host_data = self._host_buffer.numpy()
+        if device.type == "cuda":
+            self._copy_done = torch.cuda.Event()
+
+        offsets = {}
+        for name, term in policy_obs.items():
+            size = term[0].numel()
+            offsets[name] = slice(self._num_obs, self._num_obs + size)
+            self._num_obs += size
+        self._robot_state_slices = {name: offsets[term] for term, name in ROBOT_STATE_TERMS}
+
 
 def main() -> None:
     """Main teleoperation loop with recording capability."""
@@ -84,38 +229,54 @@ def main() -> None:
         recorder = DemonstrationRecorder(
             save_dir=args_cli.record_dir,
             format=args_cli.record_format,
+            record=args_cli.record_fields,
+            # Write demonstrations without stalling the teleoperation loop
+            background_save=True,
         )
         omni.log.info(
             f"Recording enabled. Demonstrations will be saved to: {args_cli.record_dir}"
         )
 
-    # State flags
-    is_teleoperating = False
-    should_reset = False
+    # State flags, shared with the gesture callbacks
+    state = SimpleNamespace(is_teleoperating=False, should_reset=False)
+
+    # Recorded environment steps are copied to the host asynchronously and added in the next loop iteration
+    step_data = StepDataCollector()
+
+    def record_pending_step() -> None:
+        """Add the environment step whose data is still being copied to the recording."""
+        pending = step_data.collect()
+        if pending is not None and recorder and recorder.is_recording:
+            observation, robot_state, action, raw_data, step_time = pending
+            recorder.add_step(
+                observation=observation,
+                action=action,
+                robot_state=robot_state,
+                hand_pose=raw_data,
+                step_time=step_time,
+            )
 
     # Callback functions
     def start_teleoperation() -> None:
         """Start teleoperation and recording."""
-        nonlocal is_teleoperating
-        is_teleoperating = True
-        if recorder:
+        state.is_teleoperating = True
+        if recorder and not recorder.is_recording:
             recorder.start_recording()
         print("✓ Teleoperation started")
 
     def stop_teleoperation() -> None:
         """Stop teleoperation and save recording."""
-        nonlocal is_teleoperating
-        is_teleoperating = False
+        state.is_teleoperating = False
+        record_pending_step()
         if recorder and recorder.is_recording:
             filepath = recorder.stop_recording()
             if filepath:
-                print(f"✓ Demonstration saved to: {filepath}")
+                print(f"✓ Saving demonstration to: {filepath}")
         print("✓ Teleoperation stopped")
 
     def reset_environment() -> None:
         """Reset the environment."""
-        nonlocal should_reset
-        should_reset = True
+        state.should_reset = True
         print("✓ Environment reset triggered")
 
     # Setup ManusVive device with Inspire hand retargeter
@@ -166,6 +327,13 @@ def main() -> None:
         # Reset environment to initial state
         env.reset()
 
+        # Action buffer reused every step; the command is broadcast to all environments
+        actions = torch.zeros(env.num_envs, env.action_manager.total_action_dim, device=env.device)
+        # Noise buffer for the perturbed copies of the command; the first (recorded) environment follows it exactly
+        action_noise = torch.empty_like(actions[1:]) if args_cli.action_noise > 0.0 else None
+        # Command of the last environment step, compared against the deadband (NaN forces the next step)
+        stepped_command = torch.full_like(actions[0], float("nan")) if args_cli.command_deadband > 0.0 else None
+
     except Exception as e:
         omni.log.error(f"Failed to create environment: {e}")
         omni.log.info("Note: Environment creation requires proper USD assets.")
@@ -186,28 +354,16 @@ def main() -> None:
 
         env = None  # No environment, direct control only
 
-    print("\n" + "=" * 60)
-    print("NINE LINKED RINGS - DEXTEROUS HAND TELEOPERATION")
-    print("=" * 60)
-    print("\nGesture Controls:")
-    print("  - Gesture 'START': Begin teleoperation and recording")
-    print("  - Gesture 'STOP':  End teleoperation and save recording")
-    print("  - Gesture 'RESET': Reset the environment")
-    print("\nTeleoperation:")
-    print("  - Right hand controls the RM75 Inspire dexterous hand")
-    print("  - All 5 fingers are independently controlled (12 DOF)")
-    print("  - Arm follows hand position and orientation (7 DOF)")
-    print("  - Total: 19 DOF precise control")
-    print("\nHand Mapping:")
-    print("  - Thumb: 4 joints (yaw, pitch, intermediate, distal)")
-    print("  - Each finger (index, middle, ring, pinky): 2 joints")
-    print(f"\nSensitivity: {args_cli.sensitivity:.2f}x")
-    print("=" * 60 + "\n")
+    print(BANNER.format(sensitivity=args_cli.sensitivity))
 
     # Reset tracking
     device.reset()
 
 
+    # Raw tracking data of the current step, refilled in place from the device for recording
+    raw_frame = RawHandFrame.empty()
+    hand_pose = raw_frame.as_dict()
+
     # Main simulation loop
     step_count = 0
     try:
@@ -217,96 +373,99 @@ def main() -> None:
             # Get device command (19 DOF: 7 arm + 12 hand)
             command = device.advance()
 
-            if is_teleoperating and command is not None:
+            # The copy of the previous step overlapped with the app update and the device poll
+            record_pending_step()
+
+            # The gesture callbacks only run during the update and the poll above
+            recording = recorder is not None and recorder.is_recording
+
+            if state.is_teleoperating and command is not None:
                 # Process the command
                 # command shape: [7 arm joints + 12 hand joints = 19 total]
 
                 if env is not None:
                     # Apply command to environment
                     try:
-                        # Ensure command is a torch tensor on CPU (env expects batch x action_dim)
-                        if isinstance(command, torch.Tensor):
-                            actions = command.unsqueeze(0).float()
-                        else:
-                            actions = torch.from_numpy(command).unsqueeze(0).float()
-
-                        # Step the environment
-                        obs, reward, terminated, truncated, info = env.step(actions)
-
-                        # Get robot state from environment
-                        if recorder and recorder.is_recording:
-                            robot_state = {
-                                "joint_positions": obs["policy"]["joint_pos"][0]
-                                .cpu()
-                                .numpy(),
-                                "joint_velocities": obs["policy"]["joint_vel"][0]
-                                .cpu()
-                                .numpy(),
-                                "hand_pose": obs["policy"]["hand_pose"][0]
-                                .cpu()
-                                .numpy(),
-                            }
-
-                            # Get raw hand data
-                            raw_data = device._get_raw_data()
-
-                            # Add to recording
-                            recorder.add_step(
-                                observation=obs["policy"].cpu().numpy().flatten(),
-                                action=command,
-                                robot_state=robot_state,
-                                hand_pose=raw_data,
-                            )
+                        # Copy the command into the persistent action buffer (env expects batch x action_dim)
+                        actions.copy_(torch.as_tensor(command))
+
+                        # Skip the step while the command stays within the deadband around the last stepped command
+                        skip_step = False
+                        if stepped_command is not None:
+                            command_change = torch.max(torch.abs(actions[0] - stepped_command))
+                            skip_step = bool(command_change < args_cli.command_deadband)
+                            if not skip_step:
+                                stepped_command.copy_(actions[0])
+
+                        if not skip_step:
+                            if action_noise is not None:
+                                actions[1:] += action_noise.normal_(std=args_cli.action_noise)
+
+                            # Step the environment
+                            obs, reward, terminated, truncated, info = env.step(actions)
+
+                            # Start copying the robot state to the host, it is recorded in the next iteration
+                            if recording:
+                                device.fill_raw_data(raw_frame)
+                                step_data.submit(obs, actions[0], hand_pose)
                     except Exception as e:
                         if step_count % 300 == 0:  # Log errors occasionally
                             omni.log.warn(f"Environment step error: {e}")
                 else:
-                    # No environment - just log commands for debugging
-                    if step_count % 60 == 0:  # Log every second at 60Hz
+                    log_command = step_count % 60 == 0  # Log every second at 60Hz
+
+                    # Copy the command to the host once for logging and recording
+                    if log_command or recording:
                         cmd_np = command.cpu().numpy() if isinstance(command, torch.Tensor) else command
-                        print(f"Hand command - Arm[0:7]: {cmd_np[:7]}")
-                        print(f"              Thumb[7:11]: {cmd_np[7:11]}")
-                        print(f"              Fingers[11:19]: {cmd_np[11:19]}")
+
+                    # No environment - just log commands for debugging
+                    if log_command:
+                        print(
+                            f"Hand command - Arm[0:7]: {cmd_np[:7]}\n"
+                            f"              Thumb[7:11]: {cmd_np[7:11]}\n"
+                            f"              Fingers[11:19]: {cmd_np[11:19]}"
+                        )
 
                     # Record even without environment
-                    if recorder and recorder.is_recording:
-                        cmd_np = command.cpu().numpy() if isinstance(command, torch.Tensor) else command
+                    if recording:
                         robot_state = {
                             "joint_positions": cmd_np,
-                            "joint_velocities": np.zeros_like(cmd_np),
-                            "hand_pose": np.zeros(7),
+                            "joint_velocities": NO_ENV_JOINT_VELOCITIES,
+                            "hand_pose": NO_ENV_HAND_POSE,
                         }
-                        raw_data = device._get_raw_data()
+                        device.fill_raw_data(raw_frame)
 
                         recorder.add_step(
-                            observation=np.zeros(50),  # Placeholder
-                            action=command,
+                            observation=NO_ENV_OBSERVATION,
+                            action=cmd_np,
                             robot_state=robot_state,
-                            hand_pose=raw_data,
+                            hand_pose=hand_pose,
                         )
 
             # Handle reset
-            if should_reset:
+            if state.should_reset:
                 if env is not None:
                     env.reset()
+                    if stepped_command is not None:
+                        stepped_command.fill_(float("nan"))
                 device.reset()
-                should_reset = False
+                state.should_reset = False
                 print("Environment reset complete")
 
             step_count += 1
 
-            # Display recording stats periodically
-            if recorder and step_count % 300 == 0:  # Every 5 seconds
-                stats = recorder.get_stats()
-                if stats.get("recording", False):
-                    print(
-                        f"Recording: {stats['num_steps']} steps, {stats['duration_seconds']:.1f}s"
-                    )
-
-            # Display teleoperation status
-            if step_count % 600 == 0 and is_teleoperating:  # Every 10 seconds
-                joint_names = retargeter.get_joint_names()
-                print(f"✓ Teleoperating - {len(joint_names)} DOF active")
+            # Display recording stats and teleoperation status periodically
+            if step_count % 300 == 0:  # Every 5 seconds
+                if recorder:
+                    stats = recorder.get_stats()
+                    if stats.get("recording", False):
+                        print(
+                            f"Recording: {stats['num_steps']} steps, {stats['duration_seconds']:.1f}s"
+                        )
+
+                if step_count % 600 == 0 and state.is_teleoperating:  # Every 10 seconds
+                    joint_names = retargeter.get_joint_names()
+                    print(f"✓ Teleoperating - {len(joint_names)} DOF active")
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
     except Exception as e:
@@ -316,10 +475,13 @@ def main() -> None:
         traceback.print_exc()
     finally:
         # Save any active recording
+        record_pending_step()
         if recorder and recorder.is_recording:
             filepath = recorder.stop_recording()
             if filepath:
                 print(f"Final demonstration saved to: {filepath}")
+        if recorder:
+            recorder.wait_for_saves()
 
         # Close environment if it was created
         if env is not None:
@@ -0,0 +1,58 @@
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+
+import pytest
+
+from teleoperation.retargeters.manus_vive_inspire_retargeter_cfg import _map_fingers
+
+SCALE = 0.02
+LOWER = 0.0
+UPPER = 1.7
+
+
+def _map_fingers_reference(raw: np.ndarray, smoothing: float, state: np.ndarray) -> np.ndarray:
+    """NumPy reference for :func:`_map_fingers` returning the new state."""
+    value = np.clip(raw * SCALE, LOWER, UPPER)
+    return np.where(np.isnan(raw), state, smoothing * state + (1.0 - smoothing) * value)
+
+
+@pytest.mark.parametrize("smoothing", [0.0, 0.3, 0.9])
+def test_map_fingers_matches_reference(smoothing):
+    """Test that the kernel matches the NumPy reference over several calls, including clipped angles."""
+    rng = np.random.default_rng(0)
+    state = np.zeros(12)
+    expected = state.copy()
+    for _ in range(5):
+        # angles beyond both joint limits
+        raw = rng.uniform(-50.0, 150.0, size=12)
+        expected = _map_fingers_reference(raw, smoothing, expected)
+        _map_fingers(raw, SCALE, LOWER, UPPER, smoothing, state)
+        np.testing.assert_allclose(state, expected)
+
+
+def test_map_fingers_clip_bounds():
+    """Test that without smoothing the state is set to the joint limits for out of range angles."""
+    raw = np.array([-100.0, 0.0, 50.0, 85.0, 1000.0])
+    state = np.full(raw.shape, 0.5)
+    _map_fingers(raw, SCALE, LOWER, UPPER, 0.0, state)
+    np.testing.assert_allclose(state, [LOWER, 0.0, 1.0, UPPER, UPPER])
+
+
+def test_map_fingers_skips_nan():
+    """Test that NaN angles keep the previous state and do not affect the other fingers."""
+    raw = np.array([np.nan, 40.0, np.nan, 10.0])
+    state = np.array([0.4, 0.4, 1.2, 0.0])
+    expected = _map_fingers_reference(raw, 0.5, state)
+    _map_fingers(raw, SCALE, LOWER, UPPER, 0.5, state)
+
+    assert not np.any(np.isnan(state))
+    np.testing.assert_allclose(state[[0, 2]], [0.4, 1.2])
+    np.testing.assert_allclose(state, expected)
@@ -0,0 +1,154 @@
+"""Test cases for the demonstration recorder."""
+
+import numpy as np
+import pickle
+
+import pytest
+
+from teleoperation.recording_utils import DemonstrationRecorder, load_demonstration
+
+FORMATS = ("pickle", "json", "npz", "hdf5")
+
+
+def _make_steps(num_steps: int) -> list[dict]:
+    """Create distinct per-step data for ``num_steps`` steps."""
+    rng = np.random.default_rng(0)
+    return [
+        {
+            "observation": rng.random(5, dtype=np.float32),
+            "action": rng.random(19, dtype=np.float32),
+            "robot_state": {
+                "joint_positions": rng.random(7, dtype=np.float32),
+                "joint_velocities": rng.random(7, dtype=np.float32),
+            },
+            "hand_pose": {"left_hand": rng.random((26, 7), dtype=np.float32)},
+        }
+        for _ in range(num_steps)
+    ]
+
+
+def _record(recorder: DemonstrationRecorder, steps: list[dict]) -> dict:
+    """Record the given steps, then save and load the demonstration."""
+    recorder.start_recording()
+    for step in steps:
+        recorder.add_step(**step)
+    filepath = recorder.stop_recording()
+    recorder.wait_for_saves()
+    return load_demonstration(filepath)
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_round_trip_grows_past_capacity(tmp_path, format):
+    """Test that every field survives a save and load after the buffers grew."""
+    steps = _make_steps(11)
+    recorder = DemonstrationRecorder(save_dir=str(tmp_path), format=format, capacity=4)
+    demo = _record(recorder, steps)
+
+    assert demo["metadata"]["num_steps"] == len(steps)
+    np.testing.assert_allclose(demo["observations"], [step["observation"] for step in steps])
+    np.testing.assert_allclose(demo["actions"], [step["action"] for step in steps])
+    for key in ("joint_positions", "joint_velocities"):
+        np.testing.assert_allclose(demo["robot_states"][key], [step["robot_state"][key] for step in steps])
+    np.testing.assert_allclose(demo["hand_poses"]["left_hand"], [step["hand_pose"]["left_hand"] for step in steps])
+    assert len(demo["timestamps"]) == len(steps)
+    assert np.all(np.diff(demo["timestamps"]) >= 0.0)
+
+
+def test_hdf5_streams_across_chunks(tmp_path, monkeypatch):
+    """Test that streamed HDF5 recordings keep all steps of full and partial chunks."""
+    monkeypatch.setattr(DemonstrationRecorder, "_HDF5_CHUNK_ROWS", 4)
+    steps = _make_steps(10)
+    recorder = DemonstrationRecorder(save_dir=str(tmp_path), format="hdf5")
+    demo = _record(recorder, steps)
+
+    np.testing.assert_allclose(demo["actions"], [step["action"] for step in steps])
+    np.testing.assert_allclose(
+        demo["robot_states"]["joint_positions"], [step["robot_state"]["joint_positions"] for step in steps]
+    )
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_record_subset(tmp_path, format):
+    """Test that only the requested fields are saved."""
+    recorder = DemonstrationRecorder(save_dir=str(tmp_path), format=format, record=("actions", "timestamps"))
+    demo = _record(recorder, _make_steps(3))
+
+    assert set(demo) == {"actions", "timestamps", "metadata"}
+    assert len(demo["actions"]) == 3
+
+
+@pytest.mark.parametrize("format", ("npz", "hdf5"))
+def test_missing_dictionary_key_is_nan(tmp_path, format):
+    """Test that a key missing in some steps keeps the NaN fill value."""
+    steps = _make_steps(3)
+    del steps[1]["robot_state"]["joint_velocities"]
+    recorder = DemonstrationRecorder(save_dir=str(tmp_path), format=format)
+    demo = _record(recorder, steps)
+
+    velocities = demo["robot_states"]["joint_velocities"]
+    assert np.all(np.isnan(velocities[1]))
+    np.testing.assert_allclose(velocities[2], steps[2]["robot_state"]["joint_velocities"])
+
+
+def test_background_save(tmp_path):
+    """Test that demonstrations written in the background are complete after waiting for the saves."""
+    steps = _make_steps(5)
+    recorder = DemonstrationRecorder(save_dir=str(tmp_path), format="npz", background_save=True)
+    demo = _record(recorder, steps)
+
+    np.testing.assert_allclose(demo["actions"], [step["action"] for step in steps])
+
+
+def test_invalid_arguments(tmp_path):
+    """Test that invalid recorder arguments are rejected."""
+    with pytest.raises(ValueError):
+        DemonstrationRecorder(save_dir=str(tmp_path), capacity=0)
+    with pytest.raises(ValueError):
+        DemonstrationRecorder(save_dir=str(tmp_path), record=("actions", "unknown"))
+
+
+def test_start_while_recording(tmp_path):
+    """Test that starting a recording while one is active is rejected and keeps the active recording."""
+    recorder = DemonstrationRecorder(save_dir=str(tmp_path), format="hdf5")
+    recorder.start_recording()
+    with pytest.raises(RuntimeError):
+        recorder.start_recording()
+    assert recorder.is_recording
+    assert recorder.stop_recording() is not None
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_empty_recording(tmp_path, format):
+    """Test that a recording without steps saves an empty array for every recorded field."""
+    recorder = DemonstrationRecorder(save_dir=str(tmp_path), format=format)
+    demo = _record(recorder, [])
+
+    assert demo["metadata"]["num_steps"] == 0
+    assert demo["metadata"]["format_version"] == DemonstrationRecorder.FORMAT_VERSION
+    for name in DemonstrationRecorder.RECORDABLE_FIELDS:
+        assert len(demo[name]) == 0
+
+
+def test_load_step_layout(tmp_path):
+    """Test that demonstrations saved with per-step lists (format version 1) are loaded in the current layout."""
+    steps = _make_steps(3)
+    legacy_demo = {
+        "observations": [step["observation"] for step in steps],
+        "actions": [step["action"] for step in steps],
+        "robot_states": [step["robot_state"] for step in steps],
+        "hand_poses": [step["hand_pose"] for step in steps],
+        "timestamps": [0.0, 0.1, 0.2],
+        "metadata": {"start_time": "", "end_time": "", "duration_seconds": 0.2, "num_steps": 3},
+    }
+    filepath = tmp_path / "demo.pkl"
+    with open(filepath, "wb") as f:
+        pickle.dump(legacy_demo, f)
+
+    demo = load_demonstration(str(filepath))
+
+    assert demo["actions"].shape == (3, 19)
+    np.testing.assert_allclose(
+        demo["robot_states"]["joint_positions"], [step["robot_state"]["joint_positions"] for step in steps]
+    )
+    assert demo["hand_poses"]["left_hand"].shape == (3, 26, 7)
+    np.testing.assert_allclose(demo["timestamps"], [0.0, 0.1, 0.2])